@@ -0,0 +1,18 @@
+from oop_ext.foundation.exceptions import ExceptionToUnicode
+
+
+def testExceptionToUnicode() -> None:
+    assert ExceptionToUnicode(RuntimeError("message")) == "message"
+
+    try:
+        try:
+            raise KeyError("original")
+        except KeyError:
+            raise RuntimeError("context")
+    except RuntimeError as e:
+        assert ExceptionToUnicode(e) == "context\n'original'"
+
+    try:
+        raise RuntimeError("cause") from ValueError("original")
+    except RuntimeError as e:
+        assert ExceptionToUnicode(e) == "cause\noriginal"
@@ -1,4 +1,5 @@
 import pytest
+import sys
 from copy import copy
 from copy import deepcopy
 
@@ -67,6 +68,24 @@ def testImmutable() -> None:
     assert AsImmutable(MySet()) == frozenset()
 
 
+def testImmutableNested() -> None:
+    value = {"a": [1, {"b": (2, [3, {4}])}, "x"], "c": {}, "d": [[[]]]}
+    immutable = AsImmutable(value)
+    assert immutable == {"a": (1, {"b": (2, (3, {4}))}, "x"), "c": {}, "d": (((),),)}
+    assert isinstance(immutable["a"][1], ImmutableDict)
+    assert isinstance(immutable["a"][1]["b"][1][1], frozenset)
+    hash(immutable)
+
+    # Deep nesting doesn't hit the recursion limit.
+    deep: list = []
+    for _ in range(sys.getrecursionlimit() * 2):
+        deep = [deep]
+    immutable = AsImmutable(deep)
+    while immutable:
+        assert isinstance(immutable, tuple)
+        (immutable,) = immutable
+
+
 def testImmutableDict() -> None:
     d = ImmutableDict(alpha=1, bravo=2)
 
@@ -88,6 +107,12 @@ def testImmutableDict() -> None:
     with pytest.raises(NotImplementedError):
         d.update({"charlie": 3})
 
+    assert hash(d) == hash(ImmutableDict(bravo=2, alpha=1))
+    # Keys don't need to be sortable.
+    assert hash(ImmutableDict({1: "a", "b": 2})) == hash(
+        ImmutableDict({"b": 2, 1: "a"})
+    )
+
 
 def testIdentityHashableRef() -> None:
     a = {1: 2}
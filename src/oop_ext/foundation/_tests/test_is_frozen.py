@@ -1,3 +1,4 @@
+from oop_ext.foundation import is_frozen
 from oop_ext.foundation.is_frozen import IsDevelopment
 from oop_ext.foundation.is_frozen import IsFrozen
 from oop_ext.foundation.is_frozen import SetIsDevelopment
@@ -11,10 +12,13 @@ def testIsFrozenIsDevelopment() -> None:
     try:
         assert IsFrozen() == False
         assert IsDevelopment() == True
+        assert is_frozen.IS_FROZEN == False
+        assert is_frozen.IS_DEVELOPMENT == True
 
         SetIsDevelopment(False)
         assert IsFrozen() == False
         assert IsDevelopment() == False
+        assert is_frozen.IS_DEVELOPMENT == False
 
         SetIsDevelopment(True)
         assert IsFrozen() == False
@@ -23,6 +27,7 @@ def testIsFrozenIsDevelopment() -> None:
         SetIsFrozen(True)
         assert IsFrozen() == True
         assert IsDevelopment() == True
+        assert is_frozen.IS_FROZEN == True
 
         SetIsFrozen(False)
         assert IsFrozen() == False
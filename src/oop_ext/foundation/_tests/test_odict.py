@@ -24,6 +24,20 @@ def testInsert() -> None:
     ]
 
 
+def testInsertNegativeIndex() -> None:
+    for index in (-1, -3, -99):
+        d = odict()
+        for key in "abcde":
+            d[key] = 0
+        d.insert(index, "x", 1)
+        assert list(d) == ["x", "a", "b", "c", "d", "e"]
+
+        # Existing keys are moved to the start too.
+        d.insert(index, "c", 2)
+        assert list(d) == ["c", "x", "a", "b", "d", "e"]
+        assert d["c"] == 2
+
+
 def testDelWithSlices() -> None:
     d = odict()
     d[1] = 1
@@ -1,6 +1,8 @@
 import copy
+import weakref
 
 from oop_ext.foundation.types_ import Null
+from oop_ext.foundation.weak_ref import GetWeakProxy
 
 
 def testNull() -> None:
@@ -9,6 +11,7 @@ def testNull() -> None:
     dummy = Null()
     dummy = Null("value")
     n = Null("value", param="value")
+    assert n is dummy  # a single instance is ever created
 
     n()
     n("value")
@@ -55,6 +58,27 @@ def testNull() -> None:
     assert hash(Null()) == hash(Null())
 
 
+def testNullSubclass() -> None:
+    class Sub(Null):
+        def __init__(self, x: int) -> None:
+            object.__setattr__(self, "x", x)
+
+    s1 = Sub(1)
+    s2 = Sub(2)
+    assert s1 is not s2
+    assert (s1.x, s2.x) == (1, 2)
+    assert s1 == s2
+    assert Sub(1) != Null()
+    assert Null() is Null()
+
+
+def testNullWeakRef() -> None:
+    n = Null()
+    assert weakref.ref(n)() is n
+    proxy = GetWeakProxy(n)
+    assert proxy.foo is n
+
+
 def testNullCopy() -> None:
     n = Null()
     n1 = copy.copy(n)
@@ -1,5 +1,6 @@
 from typing import Any
 
+import gc
 import pytest
 import sys
 import weakref
@@ -74,6 +75,23 @@ def testIsSame() -> None:
     with pytest.raises(ReferenceError):
         IsSame(p1, p2)
 
+    # The very same proxy is known to refer to the same object.
+    assert IsSame(p1, weakref.proxy(s1))
+
+
+def testCallableProxy() -> None:
+    def Func() -> None:
+        pass
+
+    p = GetWeakProxy(Func)
+    assert type(p) is weakref.CallableProxyType
+    assert IsWeakProxy(p)
+    assert not IsWeakRef(p)
+    assert GetWeakProxy(p) is p
+    assert IsSame(Func, p)
+    with pytest.raises(RuntimeError):
+        GetWeakRef(p)
+
 
 def testGetWeakRef() -> None:
     b = GetWeakRef(None)
@@ -81,6 +99,19 @@ def testGetWeakRef() -> None:
     assert b() is None
 
 
+def testGetWeakRefDoesNotKeepTypesAlive() -> None:
+    class Item:
+        pass
+
+    item = Item()
+    assert GetWeakRef(item)() is item
+
+    type_ref = weakref.ref(Item)
+    del item, Item
+    gc.collect()
+    assert type_ref() is None
+
+
 def testGeneral() -> None:
     b = _Stub()
     r = GetWeakRef(b.Method)
@@ -421,6 +452,27 @@ def testEq() -> None:
     assert rf1.is_dead()
     assert rf2.is_dead()
     assert rf1 == rf2
+    assert hash(rf1) == hash(rf2)
+
+    # Dead references to different objects are not equal (their hashes differ).
+    del d
+    assert rf3.is_dead()
+    assert rf1 != rf3
+    assert len({rf1, rf2, rf3}) == 2
+
+
+def testEqWithCallbacks() -> None:
+    _, c, _ = SetupTestAttributes()
+
+    dead: list[WeakMethodRef] = []
+    rf1 = WeakMethodRef(c.f, dead.append)
+    rf2 = WeakMethodRef(c.f, dead.append)
+    assert rf1 == rf2
+    del c
+    assert len(dead) == 2
+    # Still equal after the object dies, even though each has its own weak reference.
+    assert rf1 == rf2
+    assert hash(rf1) == hash(rf2)
 
 
 def testProxyEq() -> None:
@@ -435,6 +487,8 @@ def testProxyEq() -> None:
     assert pf1 == pf2
     assert pf1.is_dead()
     assert pf2.is_dead()
+    del d
+    assert pf1 != pf3
 
 
 def testHash() -> None:
@@ -445,9 +499,26 @@ def testHash() -> None:
     assert r == r2
     h = hash(r)
     assert hash(r) == hash(r2)
+    r3 = WeakMethodRef(c.f)
     del c
     assert r() is None
     assert hash(r) == h
+    # The hash is available even if it was never taken while the object was alive.
+    assert hash(r3) == h
+
+
+def testHashFailure() -> None:
+    class BadHash:
+        def __call__(self) -> None:
+            pass
+
+        def __hash__(self) -> int:
+            raise RuntimeError("no hash")
+
+    # Only hashing the reference fails, not creating it.
+    r = WeakMethodRef(BadHash())
+    with pytest.raises(RuntimeError, match="no hash"):
+        hash(r)
 
 
 def testRepr() -> None:
@@ -529,6 +600,105 @@ def testWeakList() -> None:
     assert len(weak_list) == 2
 
 
+def testWeakListDeadRefs() -> None:
+    stubs = [_Stub() for _ in range(6)]
+    weak_list = WeakList(stubs)
+
+    del stubs[::2]
+    assert list(weak_list) == stubs
+    assert len(weak_list.data) == 3
+
+    # Dead references are dropped even if the iteration is interrupted.
+    del stubs[0]
+    assert next(iter(weak_list)) is stubs[0]
+    assert len(weak_list.data) == 2
+
+    del stubs[0]
+    weak_list.remove(stubs[0])
+    assert weak_list.data == []
+    assert list(weak_list) == []
+
+
+def testWeakContainersRemoveDeadRefs() -> None:
+    class Item:
+        def Method(self) -> None:
+            pass
+
+    s1 = Item()
+    s2 = Item()
+    weak_list = WeakList[Any]([s1, s1.Method, s2])
+    weak_set = WeakSet[Any]()
+    weak_set.add(s1)
+    weak_set.add(s1.Method)
+    weak_set.add(s2)
+
+    # WeakSet removes references as soon as the objects die, WeakList removes all of them at
+    # once on the next access.
+    del s1
+    assert len(weak_set.data) == 1
+    assert len(weak_list.data) == 3
+    assert len(weak_list) == 1
+    assert len(weak_list.data) == 1
+
+    del s2
+    assert weak_set.data == set()
+    assert weak_list[:].data == []
+    assert weak_list.data == []
+
+
+def testWeakContainersLenWithForeignRefs() -> None:
+    class Item:
+        pass
+
+    s1 = Item()
+    s2 = Item()
+    weak_list = WeakList[Any]([s1, weakref.ref(s2)])
+    weak_set = WeakSet[Any]()
+    weak_set.add(s1)
+    weak_set.add(weakref.ref(s2))
+    list_slice = weak_list[:]
+    set_copy = weak_set.copy()
+
+    del s2
+    assert len(weak_list) == 1
+    assert len(weak_set) == 1
+    assert len(list_slice) == 1
+    assert len(set_copy) == 1
+
+    del s1
+    assert len(weak_list) == 0
+    assert len(weak_set) == 0
+    assert len(list_slice) == 0
+    assert len(set_copy) == 0
+
+
+def testWeakSetItemDiesWhileIterating() -> None:
+    class Item:
+        pass
+
+    items = [Item(), Item(), Item()]
+    weak_set = WeakSet[Item]()
+    for item in items:
+        weak_set.add(item)
+    del item
+    copied = weak_set.copy()
+
+    seen = 0
+    for _ in weak_set:
+        seen += 1
+        # Kill every remaining item: their references are removed by the callbacks while
+        # the iteration is still running.
+        del items[:]
+    assert seen == 1
+    del _
+    assert weak_set.data == set()
+
+    # The copy shares the references, which are only dropped when it is iterated.
+    assert len(copied.data) == 3
+    assert list(copied) == []
+    assert copied.data == set()
+
+
 def testSetItem() -> None:
     weak_list = WeakList[_Stub]()
     s1 = _Stub()
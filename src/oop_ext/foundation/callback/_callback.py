@@ -63,10 +63,11 @@ import logging
 import weakref
 from collections.abc import Callable
 from collections.abc import Hashable
+from collections.abc import Iterable
 from collections.abc import Sequence
 
+from oop_ext.foundation import is_frozen
 from oop_ext.foundation.compat import GetClassForUnboundMethod
-from oop_ext.foundation.is_frozen import IsDevelopment
 from oop_ext.foundation.odict import odict
 from oop_ext.foundation.types_ import Method
 from oop_ext.foundation.weak_ref import WeakMethodProxy
@@ -271,9 +272,14 @@ class Callback:
 
         to_call = []
 
+        # Bind to locals what is looked up on every iteration of the loop below.
+        pos_func_obj = self.INFO_POS_FUNC_OBJ
+        pos_func_func = self.INFO_POS_FUNC_FUNC
+        method_type = types.MethodType
+
         for cb_id, info_and_extra_args in list(callbacks.items()):  # iterate in a copy
-            info = info_and_extra_args[0]
-            func_obj = info[self.INFO_POS_FUNC_OBJ]
+            info, extra_args = info_and_extra_args
+            func_obj = info[pos_func_obj]
             if func_obj is not None:
                 # Ok, we have a self.
                 func_obj = func_obj()
@@ -281,18 +287,13 @@ class Callback:
                     # self is dead
                     del callbacks[cb_id]
                 else:
-                    func_func = info[self.INFO_POS_FUNC_FUNC]
+                    func_func = info[pos_func_func]
                     if func_func is None:
-                        to_call.append((func_obj, info_and_extra_args[1]))
+                        to_call.append((func_obj, extra_args))
                     else:
-                        to_call.append(
-                            (
-                                types.MethodType(func_func, func_obj),
-                                info_and_extra_args[1],
-                            )
-                        )
+                        to_call.append((method_type(func_func, func_obj), extra_args))
             else:
-                func_func = info[self.INFO_POS_FUNC_FUNC]
+                func_func = info[pos_func_func]
                 if func_func.__class__ == _CallbackWrapper:
                     # The instance of the _CallbackWrapper already died! (func_obj is None)
                     original_method = func_func.OriginalMethod()
@@ -301,13 +302,13 @@ class Callback:
                         continue
 
                 # No self: either classmethod or just callable
-                to_call.append((func_func, info_and_extra_args[1]))
+                to_call.append((func_func, extra_args))
 
         to_call = self._FilterToCall(to_call, args, kwargs)
 
         # Iterate over callbacks running and checking for exceptions...
-        for func, extra_args in to_call:
-            func(*extra_args + args, **kwargs)
+        for func, func_extra_args in to_call:
+            func(*func_extra_args + args, **kwargs)
 
     def _FilterToCall(self, to_call: Any, args: Any, kwargs: Any) -> Any:
         """
@@ -351,21 +352,68 @@ class Callback:
             many callbacks at once and plan to unregister them all at the same time, consider
             using `Callbacks` instead.
         """
-        if IsDevelopment() and hasattr(func, "im_class"):
-            msg = (
-                "%r object has inconsistent internal attributes and is not compatible with Callback.\n"
-                "im_class = %r\n"
-                "(If using a MagicMock, remember to pass spec=lambda:None)."
-            )
-            raise RuntimeError(msg % (func, getattr(func, "im_class")))
+        key, _was_new = self._Register(func, extra_args)
+        return UnregisterContext(self, key)
+
+    def _Register(
+        self,
+        func: Callable[..., Any],
+        extra_args: Sequence[object] = _EXTRA_ARGS_CONSTANT,
+    ) -> tuple[Hashable, bool]:
+        """
+        Implementation of :meth:`Register`.
+
+        :return:
+            The key of the registered function and whether it was not registered before this call.
+        """
+        if is_frozen.IS_DEVELOPMENT:
+            _CheckCallbackCompatible(func)
         if extra_args is not self._EXTRA_ARGS_CONSTANT:
             extra_args = tuple(extra_args)
 
         key = self._GetKey(func, extra_args)
         callbacks = self._callbacks
+        info_and_extra_args = callbacks.get(key)
+        was_new = info_and_extra_args is None or not self._ContainsEntry(
+            key, info_and_extra_args, func
+        )
         callbacks.pop(key, None)  # Remove if it exists
         callbacks[key] = (self._GetInfo(func), extra_args)
-        return UnregisterContext(self, key)
+        return key, was_new
+
+    def RegisterMany(
+        self,
+        funcs: Iterable[Callable[..., Any]],
+        extra_args: Sequence[object] = _EXTRA_ARGS_CONSTANT,
+    ) -> list["UnregisterContext"]:
+        """
+        Registers many functions in the callback at once, all sharing the same ``extra_args``.
+
+        The result is the same as calling :meth:`Register` for each function, except that when
+        one of them is not compatible with callbacks, none of them is registered.
+
+        :param funcs:
+            Methods or functions that will be called later.
+
+        :param extra_args:
+            Arguments that will be passed automatically to each of the passed functions
+            when the callback is called.
+
+        :return:
+            A list with the contexts returned by each registration, in the same order as ``funcs``.
+        """
+        funcs = list(funcs)
+        if is_frozen.IS_DEVELOPMENT:
+            # Check all of them first, so nothing is registered if any of them is not compatible.
+            for func in funcs:
+                _CheckCallbackCompatible(func)
+        if extra_args is not self._EXTRA_ARGS_CONSTANT:
+            extra_args = tuple(extra_args)
+
+        register = self._Register
+        return [
+            UnregisterContext(self, register(func, extra_args)[0]) for func in funcs
+        ]
 
     def Contains(
         self,
@@ -383,12 +431,24 @@ class Callback:
         """
         key = self._GetKey(func, extra_args)
 
-        callbacks = self._callbacks
-
-        info_and_extra_args = callbacks.get(key)
+        info_and_extra_args = self._callbacks.get(key)
         if info_and_extra_args is None:
             return False
 
+        return self._ContainsEntry(key, info_and_extra_args, func)
+
+    def _ContainsEntry(
+        self,
+        key: Hashable,
+        info_and_extra_args: tuple[Any, tuple[object, ...]],
+        func: Callable[..., Any],
+    ) -> bool:
+        """
+        Checks whether the entry registered with the given key is actually ``func``.
+
+        Entries whose function is already dead are removed from the callbacks.
+        """
+        callbacks = self._callbacks
         real_func: Callable | None = func
 
         if isinstance(real_func, WeakMethodProxy):
@@ -405,7 +465,7 @@ class Callback:
             func_obj = func_obj()
             if func_obj is None:
                 # self is dead
-                del callbacks[key]
+                callbacks.pop(key, None)
                 return False
             else:
                 return real_func is func_obj or (
@@ -417,7 +477,7 @@ class Callback:
                 # The instance of the _CallbackWrapper already died! (func_obj is None)
                 original_method = func_func.OriginalMethod()
                 if original_method is None:
-                    del callbacks[key]
+                    callbacks.pop(key, None)
                     return False
                 return original_method == real_func
 
@@ -466,6 +526,16 @@ class Callback:
         return len(self._callbacks)
 
 
+def _CheckCallbackCompatible(func: object) -> None:
+    if hasattr(func, "im_class"):
+        msg = (
+            "%r object has inconsistent internal attributes and is not compatible with Callback.\n"
+            "im_class = %r\n"
+            "(If using a MagicMock, remember to pass spec=lambda:None)."
+        )
+        raise RuntimeError(msg % (func, getattr(func, "im_class")))
+
+
 def _IsCallableObject(func: object) -> bool:
     return (
         not inspect.isbuiltin(func)
@@ -502,6 +572,8 @@ _UnregisterContext = UnregisterContext
 
 
 class _CallbackWrapper(Method):
+    __slots__ = ["weak_method_callback", "OriginalMethod", "__weakref__"]
+
     def __init__(self, weak_method_callback: Callable) -> None:
         self.weak_method_callback = weak_method_callback
 
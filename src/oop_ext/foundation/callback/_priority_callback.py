@@ -4,6 +4,7 @@ from typing import Any
 from typing import Tuple
 
 from collections.abc import Callable
+from collections.abc import Iterable
 
 from oop_ext.foundation.decorators import Override
 from oop_ext.foundation.odict import odict
@@ -60,13 +61,33 @@ class PriorityCallback(Callback):
         callbacks.pop(key, None)  # Remove if it exists
         new_info = self._GetInfo(func, priority)
 
+        # Callbacks are kept sorted by priority, so calling never needs to sort them. Usually
+        # they're registered in priority order, in which case the new one just goes last.
+        if not callbacks or (
+            next(reversed(callbacks.values()))[0][self.INFO_POS_PRIORITY] <= priority
+        ):
+            callbacks[key] = (new_info, extra_args)
+            return UnregisterContext(self, key)
+
         i = 0
         for i, (info, _extra) in enumerate(callbacks.values()):
             if info[self.INFO_POS_PRIORITY] > priority:
                 break
-        else:
-            # Iterated all... so, go one more the last position.
-            i += 1
 
         callbacks.insert(i, key, (new_info, extra_args))
         return UnregisterContext(self, key)
+
+    @Override(Callback.RegisterMany)
+    def RegisterMany(  # type:ignore[misc, override]
+        self,
+        funcs: Iterable[Callable],
+        extra_args: tuple[object, ...] = Callback._EXTRA_ARGS_CONSTANT,
+        priority: int = 5,
+    ) -> list[UnregisterContext]:
+        """
+        Register many functions in the callback, all with the same priority.
+
+        :param int priority:
+            See :meth:`Register`.
+        """
+        return [self.Register(func, extra_args, priority=priority) for func in funcs]
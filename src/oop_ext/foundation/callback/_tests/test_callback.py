@@ -1,5 +1,6 @@
 from typing import Any
 from typing import List
+from typing import NamedTuple
 
 import pytest
 import weakref
@@ -39,6 +40,157 @@ class Stub:
         pass
 
 
+class _WhenLogger:
+    """Callable which logs its label into ``events`` when called."""
+
+    # Callbacks keep weak references to callable objects.
+    __slots__ = ("events", "label", "__weakref__")
+
+    def __init__(self, events: list[str], label: str) -> None:
+        self.events = events
+        self.label = label
+
+    def __call__(self, arg: int) -> None:
+        assert arg == 42
+        self.events.append(self.label)
+
+
+class _MagicLike:
+    """Object with a stale ``im_class`` attribute, as created by MagicMock without a spec."""
+
+    im_class = None
+
+    def __call__(self):
+        pass
+
+
+class _Receiver:
+    def __init__(self, test_case):
+        self.test_case = test_case
+
+    def before(self, *args):
+        self.test_case.before_count += 1
+        self.test_case.before_args = args
+
+    def on_foo(self, *args):
+        self.test_case.args = args
+
+
+class _Sender:
+    def __init__(self, test_case):
+        self.test_case = test_case
+
+    def foo(self, *args):
+        self.args = args
+
+    def __del__(self):
+        self.test_case.sender_died = True
+
+
+class _A:
+    def foo(self):
+        pass
+
+
+class _CallableObj:
+    def __init__(self):
+        self.called = False
+
+    def __call__(self):
+        self.called = True
+
+
+class _Obj:
+    def Foo(self):
+        self.called = True
+
+
+class _StrongReferenceObj(_CallableObj):
+    __CALLBACK_KEEP_STRONG_REFERENCE__ = True
+
+
+class _WeakProxyFoo:
+    def __init__(self):
+        Before(self.SetFilename, GetWeakProxy(self._BeforeSetFilename))
+        After(self.SetFilename, GetWeakProxy(self._AfterSetFilename))
+        self.before = False
+        self.after = False
+
+    def _BeforeSetFilename(self, *args, **kwargs):
+        self.before = True
+
+    def _AfterSetFilename(self, *args, **kwargs):
+        self.after = True
+
+    def SetFilename(self, f):
+        pass
+
+
+class _MyNullSubClass(Null):
+    def GetIstodraw(self):
+        return True
+
+
+class _ValueA:
+    def __init__(self, **ka):
+        super().__init__(**ka)
+        self.c = Callback()
+        self.value = 0.0
+        self.other_value = 0.0
+        self.c.Register(self._UpdateBValue)
+
+    def SetValue(self, value):
+        self.value = value
+        self.c(value)
+
+    def _UpdateBValue(self, new_value):
+        self.other_value = new_value / 0  # division by zero
+
+
+class _ValueB:
+    def __init__(self, **ka):
+        super().__init__(**ka)
+        self.c = Callback()
+        self._a = _ValueA()
+        self.value = 0.0
+        self.c.Register(self._UpdateAValue)
+
+    def SetValue(self, value):
+        self.value = value
+        self.c(value * 0.1)
+
+    def _UpdateAValue(self, new_value):
+        self._a.SetValue(new_value)
+
+
+class _CallState(NamedTuple):
+    """
+    The state recorded by the calls in the override tests.
+    """
+
+    foo_called: Any
+    after_called: Any
+    after_count: int
+    before_called: Any
+    before_count: int
+
+
+# Pristine methods of the shared test classes, captured once at import time.
+_ORIGINAL_STUB_CALL = Stub.call
+_ORIGINAL_C_FOO = C.foo
+
+
+def _AssertCollected(ref: weakref.ReferenceType) -> None:
+    """
+    Checks that the object referenced by ``ref`` has been freed.
+
+    ``gc.collect()`` is deliberately not called: objects must be freed by reference counting
+    alone, so a reference cycle created by the callback machinery makes the check fail.
+    """
+    obj = ref()
+    assert obj is None, f"Object should have been collected: {obj!r}"
+
+
 @pytest.fixture(autouse=True)
 def restore_test_classes() -> Generator[None, None, None]:
     """
@@ -49,12 +201,9 @@ def restore_test_classes() -> Generator[None, None, None]:
     these test classes used are always restored to clean state to avoid undesired side-effects in
     other tests.
     """
-    original_stub_call = Stub.call
-    original_c_foo = C.foo
-
     yield
-    Stub.call = original_stub_call  # type:ignore[assignment]
-    C.foo = original_c_foo  # type:ignore[assignment]
+    Stub.call = _ORIGINAL_STUB_CALL  # type:ignore[assignment]
+    C.foo = _ORIGINAL_C_FOO  # type:ignore[assignment]
 
 
 class Test:
@@ -85,61 +234,81 @@ class Test:
         After(C.foo, self.after)
 
         self.a.foo(1)
-        assert self.foo_called == (self.a, 1)
-        assert self.after_called == (self.a, 1)
-        assert self.after_count == 1
-        assert self.before_called == (self.a, 1)
-        assert self.before_count == 1
+        assert self._GetCallState() == _CallState(
+            foo_called=(self.a, 1),
+            after_called=(self.a, 1),
+            after_count=1,
+            before_called=(self.a, 1),
+            before_count=1,
+        )
 
         self.b.foo(2)
-        assert self.foo_called == (self.b, 2)
-        assert self.after_called == (self.b, 2)
-        assert self.after_count == 2
-        assert self.before_called == (self.b, 2)
-        assert self.before_count == 2
+        assert self._GetCallState() == _CallState(
+            foo_called=(self.b, 2),
+            after_called=(self.b, 2),
+            after_count=2,
+            before_called=(self.b, 2),
+            before_count=2,
+        )
 
         assert Remove(C.foo, self.before)
 
         self.a.foo(3)
-        assert self.foo_called == (self.a, 3)
-        assert self.after_called == (self.a, 3)
-        assert self.after_count == 3
-        assert self.before_called == (self.b, 2)
-        assert self.before_count == 2
+        assert self._GetCallState() == _CallState(
+            foo_called=(self.a, 3),
+            after_called=(self.a, 3),
+            after_count=3,
+            before_called=(self.b, 2),
+            before_count=2,
+        )
 
     def testInstanceOverride(self) -> None:
         Before(self.a.foo, self.before)
         After(self.a.foo, self.after)
 
         self.a.foo(1)
-        assert self.foo_called == (self.a, 1)
-        assert self.after_called == (1,)
-        assert self.before_called == (1,)
-        assert self.after_count == 1
-        assert self.before_count == 1
+        assert self._GetCallState() == _CallState(
+            foo_called=(self.a, 1),
+            after_called=(1,),
+            after_count=1,
+            before_called=(1,),
+            before_count=1,
+        )
 
         self.b.foo(2)
-        assert self.foo_called == (self.b, 2)
-        assert self.after_called == (1,)
-        assert self.before_called == (1,)
-        assert self.after_count == 1
-        assert self.before_count == 1
+        assert self._GetCallState() == _CallState(
+            foo_called=(self.b, 2),
+            after_called=(1,),
+            after_count=1,
+            before_called=(1,),
+            before_count=1,
+        )
 
         assert Remove(self.a.foo, self.before) == True
 
         self.a.foo(2)
-        assert self.foo_called == (self.a, 2)
-        assert self.after_called == (2,)
-        assert self.before_called == (1,)
-        assert self.after_count == 2
-        assert self.before_count == 1
+        assert self._GetCallState() == _CallState(
+            foo_called=(self.a, 2),
+            after_called=(2,),
+            after_count=2,
+            before_called=(1,),
+            before_count=1,
+        )
 
         Before(self.a.foo, self.before)
         Before(self.a.foo, self.before)  # Registering twice has no effect the 2nd time
 
         self.a.foo(5)
-        assert self.before_called == (5,)
-        assert self.before_count == 2
+        assert (self.before_called, self.before_count) == ((5,), 2)
+
+    def _GetCallState(self) -> _CallState:
+        return _CallState(
+            foo_called=self.foo_called,
+            after_called=self.after_called,
+            after_count=self.after_count,
+            before_called=self.before_called,
+            before_count=self.before_count,
+        )
 
     def testBoundMethodsWrong(self) -> None:
         foo = self.a.foo
@@ -160,12 +329,7 @@ class Test:
         assert self.after_count == 1
 
     def testReferenceDies(self) -> None:
-        class Receiver:
-            def before(dummy, *args):  # @NoSelf
-                self.before_count += 1
-                self.before_args = args
-
-        rec = Receiver()
+        rec = _Receiver(self)
         self.before_count = 0
         self.before_args = None
 
@@ -176,22 +340,17 @@ class Test:
         assert self.before_args == (10,)
         assert self.before_count == 1
 
+        rec_ref = weakref.ref(rec)
         del rec  # kill the receiver
+        _AssertCollected(rec_ref)
 
         foo(20)
         assert self.before_args == (10,)
         assert self.before_count == 1
 
     def testSenderDies(self) -> None:
-        class Sender:
-            def foo(s, *args):  # @NoSelf
-                s.args = args
-
-            def __del__(dummy):  # @NoSelf
-                self.sender_died = True
-
         self.sender_died = False
-        s = Sender()
+        s = _Sender(self)
         w = weakref.ref(s)
         Before(s.foo, self.before)
         s.foo(10)
@@ -205,7 +364,7 @@ class Test:
 
         with pytest.raises(ReferenceError):
             f(10)  # must have already died: we don't have a strong reference
-        assert w() is None
+        _AssertCollected(w)
 
     def testLessArgs(self) -> None:
         class C:
@@ -292,7 +451,6 @@ class Test:
 
         alpha = Callback()
         alpha.Register(zulu_one, (1, 2))
-
         assert self.zulu_calls == []
 
         alpha("a")
@@ -303,6 +461,7 @@ class Test:
 
         # Test a second method with extra-args
         alpha.Register(zulu_too, (9,))
+        assert len(self.zulu_calls) == 2
 
         alpha("a")
         assert self.zulu_calls == [
@@ -365,12 +524,8 @@ class Test:
     args: Any
 
     def testCallbackReceiverDies(self) -> None:
-        class A:
-            def on_foo(dummy, *args):  # @NoSelf
-                self.args = args
-
         self.args = None
-        a = A()
+        a = _Receiver(self)
         weak_a = weakref.ref(a)
 
         foo = Callback()
@@ -385,21 +540,17 @@ class Test:
         assert weak_a() is a
 
         del a
-        assert weak_a() is None
+        _AssertCollected(weak_a)
         foo(5, 6)
         assert self.args == (3, 4)
 
     def testActionMethodDies(self) -> None:
-        class A:
-            def foo(self):
-                pass
-
         def FooAfter():
             self.after_exec += 1
 
         self.after_exec = 0
 
-        a = A()
+        a = _A()
         weak_a = weakref.ref(a)
         After(a.foo, FooAfter)
         a.foo()
@@ -414,7 +565,7 @@ class Test:
         # callback creates a circular reference; that's ok, because we want
         # to still be able to do "x = a.foo" and keep a strong reference to it
 
-        assert weak_a() is None
+        _AssertCollected(weak_a)
 
     def testAfterRegisterMultipleAndUnregisterOnce(self) -> None:
         class A:
@@ -494,22 +645,20 @@ class Test:
         self.after_called = None
         self.foo_called = None
         del self.a
-        assert a() is None
+        _AssertCollected(a)
 
     def testCallbacksBeforeAfter(self) -> None:
         """
         Callbacks.Before and After should call the registered function before/after another
         function.
         """
-        events = []
-
-        def bar(arg, when):
-            assert arg == 42
-            events.append(when)
+        events: list[str] = []
+        before_bar = _WhenLogger(events, "before_bar")
+        after_bar = _WhenLogger(events, "after_bar")
 
         callbacks = Callbacks()
-        callbacks.Before(self.a.foo, partial(bar, when="before_bar"))
-        callbacks.After(self.a.foo, partial(bar, when="after_bar"))
+        callbacks.Before(self.a.foo, before_bar)
+        callbacks.After(self.a.foo, after_bar)
 
         self.a.foo(42)
         assert events == ["before_bar", "after_bar"]
@@ -628,7 +777,7 @@ class Test:
         my_object.SetAlpha(4)
         assert 3 == self._a_value
         assert 4 == self._b_value
-        assert w() is None
+        _AssertCollected(w)
 
     def testRemoveCallbackPlain(self) -> None:
         class C:
@@ -692,6 +841,36 @@ class Test:
         c2("c2-second")
         assert events == ["c1-first", "c2-first"]
 
+    def testRegisterMany(self) -> None:
+        called = []
+
+        def Foo(*args):
+            called.append(("foo", args))
+
+        def Bar(*args):
+            called.append(("bar", args))
+
+        c = Callback()
+        contexts = c.RegisterMany([Foo, Bar, Foo], extra_args=(1,))
+        assert len(contexts) == 3
+        assert len(c) == 2
+        assert c.Contains(Foo, (1,))
+        assert c.Contains(Bar, (1,))
+
+        c(2)
+        assert called == [("bar", (1, 2)), ("foo", (1, 2))]
+
+        contexts[1].Unregister()
+        called.clear()
+        c(3)
+        assert called == [("foo", (1, 3))]
+
+        # Nothing is registered when one of the functions is not compatible.
+        with pytest.raises(RuntimeError):
+            c.RegisterMany([Bar, _MagicLike()])
+        assert not c.Contains(Bar)
+        assert len(c) == 1
+
     def testRegisterTwice(self) -> None:
         self.called = 0
 
@@ -827,6 +1006,24 @@ class Test:
         assert not c.Contains(AfterMethodB)
         assert len(c) == 0
 
+    def testRegisterReturnsWhetherNew(self, monkeypatch) -> None:
+        def AfterMethod(*args):
+            pass
+
+        def AfterMethodB(*args):
+            pass
+
+        c = Callback()
+        key, was_new = c._Register(AfterMethod)
+        assert was_new
+        assert c._Register(AfterMethod) == (key, False)
+        assert c.Contains(AfterMethod)
+
+        # Functions with the same key are not the same function.
+        monkeypatch.setattr(Callback, "_GetKey", lambda *args, **kwargs: 1)
+        assert c._Register(AfterMethodB) == (1, True)
+        assert c.Contains(AfterMethodB)
+
     def testNeedsUnregister(self) -> None:
         c = Callback()
 
@@ -893,10 +1090,6 @@ class Test:
         assert [("call_instance", True)] == vals
 
     def testOnNullClass(self) -> None:
-        class _MyNullSubClass(Null):
-            def GetIstodraw(self):
-                return True
-
         s = _MyNullSubClass()
 
         def AfterSetIstodraw():
@@ -971,57 +1164,25 @@ class Test:
         assert len(magic_mock.call_args_list) == 2
 
     def testCallbackInstanceWeakRef(self) -> None:
-        class Obj:
-            def __init__(self):
-                self.called = False
-
-            def __call__(self):
-                self.called = True
-
         c = Callback()
-        obj = Obj()
+        obj = _CallableObj()
         c.Register(obj)
         c()
         assert c.Contains(obj)
         assert obj.called
         obj_ref = weakref.ref(obj)
         del obj
-        assert obj_ref() is None
+        _AssertCollected(obj_ref)
 
     def testBeforeAfterWeakProxy(self) -> None:
-        class Foo:
-            def __init__(self):
-                Before(self.SetFilename, GetWeakProxy(self._BeforeSetFilename))
-                After(self.SetFilename, GetWeakProxy(self._AfterSetFilename))
-                self.before = False
-                self.after = False
-
-            def _BeforeSetFilename(self, *args, **kwargs):
-                self.before = True
-
-            def _AfterSetFilename(self, *args, **kwargs):
-                self.after = True
-
-            def SetFilename(self, f):
-                pass
-
-        foo = Foo()
+        foo = _WeakProxyFoo()
         foo.SetFilename("bar")
         assert foo.before
         assert foo.after
 
     def testKeepStrongReference(self) -> None:
-        class Obj:
-            __CALLBACK_KEEP_STRONG_REFERENCE__ = True
-
-            def __init__(self):
-                self.called = False
-
-            def __call__(self):
-                self.called = True
-
         c = Callback()
-        obj = Obj()
+        obj = _StrongReferenceObj()
         c.Register(obj)
         c()
         assert c.Contains(obj)
@@ -1032,11 +1193,7 @@ class Test:
         assert obj_ref() is not None
 
     def testWeakMethodProxy(self) -> None:
-        class Obj:
-            def Foo(self):
-                self.called = True
-
-        obj = Obj()
+        obj = _Obj()
         proxy = WeakMethodProxy(obj.Foo)
 
         c = Callback()
@@ -1046,7 +1203,7 @@ class Test:
         assert c.Contains(proxy)
         obj_ref = weakref.ref(obj)
         del obj
-        assert obj_ref() is None
+        _AssertCollected(obj_ref)
         c()
         assert len(c) == 0
 
@@ -1068,8 +1225,6 @@ class Test:
         assert c_ref() is c
 
     def testCallbackAndPartial(self) -> None:
-        from functools import partial
-
         called = []
 
         def Method(a):
@@ -1082,38 +1237,6 @@ class Test:
         assert called == ["lambda", "partial"]
 
     def testCallbackInsideCallback(self) -> None:
-        class A:
-            c = Callback()
-
-            def __init__(self, **ka):
-                super().__init__(**ka)
-                self.value = 0.0
-                self.other_value = 0.0
-                self.c.Register(self._UpdateBValue)
-
-            def SetValue(self, value):
-                self.value = value
-                self.c(value)
-
-            def _UpdateBValue(self, new_value):
-                self.other_value = new_value / 0  # division by zero
-
-        class B:
-            c = Callback()
-
-            def __init__(self, **ka):
-                super().__init__(**ka)
-                self._a = A()
-                self.value = 0.0
-                self.c.Register(self._UpdateAValue)
-
-            def SetValue(self, value):
-                self.value = value
-                self.c(value * 0.1)
-
-            def _UpdateAValue(self, new_value):
-                self._a.SetValue(new_value)
-
-        b = B()
+        b = _ValueB()
         with pytest.raises(ZeroDivisionError):
             b.SetValue(5)
@@ -34,3 +34,24 @@ def testPriorityCallback() -> None:
     unregister5.Unregister()
     priority_callback()
     assert called == [3, 1, 2, 4]
+
+
+def testPriorityCallbackRegisterMany() -> None:
+    priority_callback = PriorityCallback0()
+
+    called = []
+
+    def OnCall1():
+        called.append(1)
+
+    def OnCall2():
+        called.append(2)
+
+    def OnCall3():
+        called.append(3)
+
+    priority_callback.Register(OnCall1, priority=2)
+    priority_callback.RegisterMany([OnCall2, OnCall3], priority=1)
+
+    priority_callback()
+    assert called == [2, 3, 1]
@@ -1,4 +1,5 @@
 import pytest
+import weakref
 
 from oop_ext.foundation.callback.single_call_callback import SingleCallCallback
 
@@ -85,3 +86,40 @@ def testSingleCallCallbackNoParameter() -> None:
     callback.Unregister(Method1)
     callback.Register(Method1)
     assert called == ["Method1", "Method2", "Method1", "Method2", "Method1"]
+
+
+def testSingleCallCallbackRegisterBeforeCall() -> None:
+    class Stub:
+        pass
+
+    stub = Stub()
+    callback = SingleCallCallback(stub)
+
+    called = []
+
+    def Method1(arg):
+        called.append(arg)
+
+    del stub
+    # The callback parameter is only needed once the callback is called.
+    callback.Register(Method1)
+    assert called == []
+
+    with pytest.raises(ReferenceError):
+        callback()
+
+
+def testSingleCallCallbackAllowCallingAgainReleasesArgs() -> None:
+    class Stub:
+        pass
+
+    stub = Stub()
+    stub_ref = weakref.ref(stub)
+    callback = SingleCallCallback(None)
+    callback(stub, stub=stub)
+
+    del stub
+    assert stub_ref() is not None
+
+    callback.AllowCallingAgain()
+    assert stub_ref() is None
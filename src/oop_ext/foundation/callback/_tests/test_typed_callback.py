@@ -1,9 +1,13 @@
+import ast
 from typing import Tuple
 
+import inspect
 import pytest
 import re
+from pathlib import Path
 
 from oop_ext._type_checker_fixture import TypeCheckerFixture
+from oop_ext.foundation.callback import _typed_callback
 
 
 def testCallback0(type_checker: TypeCheckerFixture) -> None:
@@ -221,3 +225,64 @@ def testAllCallbacksSmokeTest(
             "Too many arguments",
         ]
     )
+
+
+def testStubMatchesRuntimeClasses() -> None:
+    """
+    The typed variants are created dynamically, so their signatures are only declared in the
+    ``.pyi`` stub: check that it declares the same classes, with methods matching the runtime ones.
+    """
+    stub_path = Path(_typed_callback.__file__).with_suffix(".pyi")
+    stub = ast.parse(stub_path.read_text(encoding="utf-8"))
+    stub_classes = {
+        node.name: node for node in stub.body if isinstance(node, ast.ClassDef)
+    }
+
+    runtime_names = {
+        name
+        for name, value in vars(_typed_callback).items()
+        if isinstance(value, type) and value.__module__ == _typed_callback.__name__
+    }
+    assert stub_classes.keys() == runtime_names
+
+    for name, class_def in stub_classes.items():
+        runtime_class = getattr(_typed_callback, name)
+        type_params = [t.__name__ for t in getattr(runtime_class, "__parameters__", ())]
+        expected_bases = [runtime_class.__bases__[0].__name__]
+        if type_params:
+            expected_bases.append(f"Generic[{', '.join(type_params)}]")
+        assert [ast.unparse(base) for base in class_def.bases] == expected_bases, name
+
+        for method_def in class_def.body:
+            assert isinstance(method_def, ast.FunctionDef), name
+            stub_args = method_def.args
+            runtime_params = list(
+                inspect.signature(
+                    getattr(runtime_class, method_def.name)
+                ).parameters.values()
+            )
+            if method_def.name == "__call__":
+                # The runtime accepts any arguments, the stub one per type parameter.
+                assert len(stub_args.args) == len(type_params) + 1, name
+                assert [p.kind for p in runtime_params[1:]] == [
+                    inspect.Parameter.VAR_POSITIONAL,
+                    inspect.Parameter.VAR_KEYWORD,
+                ], name
+                continue
+
+            method_name = f"{name}.{method_def.name}"
+            assert [a.arg for a in stub_args.args] == [
+                p.name for p in runtime_params
+            ], method_name
+            runtime_defaults = [
+                p.default
+                for p in runtime_params
+                if p.default is not inspect.Parameter.empty
+            ]
+            assert len(stub_args.defaults) == len(runtime_defaults), method_name
+            for stub_default, runtime_default in zip(
+                stub_args.defaults, runtime_defaults
+            ):
+                stub_value = ast.literal_eval(stub_default)
+                if stub_value is not Ellipsis:
+                    assert stub_value == runtime_default, method_name
@@ -0,0 +1,261 @@
+from typing import Generic
+from typing import TypeVar
+
+from collections.abc import Callable
+from collections.abc import Sequence
+
+from ._callback import Callback
+from ._callback import UnregisterContext as UnregisterContext
+from ._priority_callback import PriorityCallback
+
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+T3 = TypeVar("T3")
+T4 = TypeVar("T4")
+T5 = TypeVar("T5")
+
+class Callback0(Callback):
+    def __call__(self) -> None:  # type:ignore[override]
+        ...
+
+    def Register(
+        self,
+        func: Callable[[], None],
+        extra_args: Sequence[object] = ...,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class Callback1(Callback, Generic[T1]):
+    def __call__(self, v1: T1) -> None:  # type:ignore[override]
+        ...
+
+    def Register(
+        self,
+        func: Callable[[T1], None],
+        extra_args: Sequence[object] = ...,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class Callback2(Callback, Generic[T1, T2]):
+    def __call__(self, v1: T1, v2: T2) -> None:  # type:ignore[override]
+        ...
+
+    def Register(
+        self,
+        func: Callable[[T1, T2], None],
+        extra_args: Sequence[object] = ...,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class Callback3(Callback, Generic[T1, T2, T3]):
+    def __call__(self, v1: T1, v2: T2, v3: T3) -> None:  # type:ignore[override]
+        ...
+
+    def Register(
+        self,
+        func: Callable[[T1, T2, T3], None],
+        extra_args: Sequence[object] = ...,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2, T3], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2, T3], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class Callback4(Callback, Generic[T1, T2, T3, T4]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1, v2: T2, v3: T3, v4: T4
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1, T2, T3, T4], None],
+        extra_args: Sequence[object] = ...,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2, T3, T4], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2, T3, T4], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class Callback5(Callback, Generic[T1, T2, T3, T4, T5]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1, v2: T2, v3: T3, v4: T4, v5: T5
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1, T2, T3, T4, T5], None],
+        extra_args: Sequence[object] = ...,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2, T3, T4, T5], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2, T3, T4, T5], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class PriorityCallback0(PriorityCallback):
+    def __call__(self) -> None:  # type:ignore[override]
+        ...
+
+    def Register(
+        self,
+        func: Callable[[], None],
+        extra_args: Sequence[object] = ...,
+        priority: int = 5,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class PriorityCallback1(PriorityCallback, Generic[T1]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1], None],
+        extra_args: Sequence[object] = ...,
+        priority: int = 5,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class PriorityCallback2(PriorityCallback, Generic[T1, T2]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1, v2: T2
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1, T2], None],
+        extra_args: Sequence[object] = ...,
+        priority: int = 5,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class PriorityCallback3(PriorityCallback, Generic[T1, T2, T3]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1, v2: T2, v3: T3
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1, T2, T3], None],
+        extra_args: Sequence[object] = ...,
+        priority: int = 5,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2, T3], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2, T3], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class PriorityCallback4(PriorityCallback, Generic[T1, T2, T3, T4]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1, v2: T2, v3: T3, v4: T4
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1, T2, T3, T4], None],
+        extra_args: Sequence[object] = ...,
+        priority: int = 5,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2, T3, T4], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2, T3, T4], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
+
+class PriorityCallback5(PriorityCallback, Generic[T1, T2, T3, T4, T5]):
+    def __call__(  # type:ignore[override]
+        self, v1: T1, v2: T2, v3: T3, v4: T4, v5: T5
+    ) -> None: ...
+    def Register(
+        self,
+        func: Callable[[T1, T2, T3, T4, T5], None],
+        extra_args: Sequence[object] = ...,
+        priority: int = 5,
+    ) -> UnregisterContext: ...
+    def Unregister(
+        self,
+        func: Callable[[T1, T2, T3, T4, T5], None],
+        extra_args: Sequence[object] = ...,
+    ) -> None: ...
+    def Contains(
+        self,
+        func: Callable[[T1, T2, T3, T4, T5], None],
+        extra_args: Sequence[object] = ...,
+    ) -> bool: ...
@@ -1,12 +1,15 @@
 # mypy: disallow-untyped-defs
 # mypy: disallow-any-decorated
-from typing import Dict
-from typing import Tuple
-
 from collections.abc import Callable
 
+from oop_ext.foundation.weak_ref import GetWeakRef
+
 from ._callback import Callback
 
+# Shared defaults for callbacks not called yet: never mutated, ``__call__`` replaces them.
+_EMPTY_ARGS: tuple[object, ...] = ()
+_EMPTY_KWARGS: dict[str, object] = {}
+
 
 class SingleCallCallback:
     """
@@ -16,14 +19,21 @@ class SingleCallCallback:
     The callback parameter is pre-registered and kept as a weak-reference.
     """
 
+    __slots__ = [
+        "_callback_parameter",
+        "_done_callbacks",
+        "_done",
+        "_args",
+        "_kwargs",
+        "__weakref__",
+    ]
+
     def __init__(self, callback_parameter: object) -> None:
         """
         :param object callback_parameter:
             A weak-reference is kept to this object (because the usual use-case is making a call
             passing the object that contains this callback).
         """
-        from oop_ext.foundation.weak_ref import GetWeakRef
-
         if callback_parameter is None:
             self._callback_parameter = None
         else:
@@ -31,8 +41,8 @@ class SingleCallCallback:
         self._done_callbacks = Callback()
         self._done = False
 
-        self._args: tuple[object, ...] = ()
-        self._kwargs: dict[str, object] = {}
+        self._args: tuple[object, ...] = _EMPTY_ARGS
+        self._kwargs: dict[str, object] = _EMPTY_KWARGS
 
     def __call__(self, *args: object, **kwargs: object) -> None:
         if self._done:
@@ -40,21 +50,28 @@ class SingleCallCallback:
 
         # Keep the args passed to call it later on...
         self._args = args
-        self._kwargs = kwargs
+        self._kwargs = kwargs if kwargs else _EMPTY_KWARGS
 
-        if self._callback_parameter is not None:
-            callback_parameter = self._callback_parameter()
-            if callback_parameter is None:
-                raise ReferenceError("Callback parameter is already garbage collected.")
-        else:
-            callback_parameter = None
+        args = self._PrefixArgs(args)
 
         # We can dispose of it (as of now, callbacks should be called directly).
         self._done = True
-        if callback_parameter is not None:
-            self._done_callbacks(callback_parameter, *args, **kwargs)
-        else:
+        if kwargs:
             self._done_callbacks(*args, **kwargs)
+        else:
+            self._done_callbacks(*args)
+
+    def _PrefixArgs(self, args: tuple[object, ...]) -> tuple[object, ...]:
+        """
+        Returns the arguments to pass to the registered callbacks: ``args`` prefixed by the
+        callback parameter, if there's one.
+        """
+        if self._callback_parameter is None:
+            return args
+        callback_parameter = self._callback_parameter()
+        if callback_parameter is None:
+            raise ReferenceError("Callback parameter is already garbage collected.")
+        return (callback_parameter,) + args
 
     def Unregister(self, fn: Callable) -> None:
         self._done_callbacks.Unregister(fn)
@@ -63,21 +80,18 @@ class SingleCallCallback:
         self._done_callbacks.UnregisterAll()
 
     def Register(self, fn: Callable) -> None:
-        if self._callback_parameter is not None:
-            callback_parameter = self._callback_parameter()
-            if callback_parameter is None:
-                raise ReferenceError("Callback parameter is already garbage collected.")
-        else:
-            callback_parameter = None
-
-        contains = self._done_callbacks.Contains(fn)
-
-        self._done_callbacks.Register(fn)
-        if self._done and not contains:
-            if callback_parameter is not None:
-                fn(callback_parameter, *self._args, **self._kwargs)
+        if not self._done:
+            # Not called yet: the callback parameter is only needed when calling.
+            self._done_callbacks.Register(fn)
+            return
+
+        args = self._PrefixArgs(self._args)
+        _key, was_new = self._done_callbacks._Register(fn)
+        if was_new:
+            if self._kwargs:
+                fn(*args, **self._kwargs)
             else:
-                fn(*self._args, **self._kwargs)
+                fn(*args)
 
     def AllowCallingAgain(self) -> None:
         """
@@ -86,5 +100,9 @@ class SingleCallCallback:
 
         By calling this method, we allow calling this callback again (and stop directly notifying
         clients just registered until it's called again).
+
+        The arguments of the previous call are released.
         """
         self._done = False
+        self._args = _EMPTY_ARGS
+        self._kwargs = _EMPTY_KWARGS
@@ -14,20 +14,18 @@ def GetClassForUnboundMethod(method: Any) -> Any:
     However this has a drawback: callback to method of local classes AREN'T SUPPORTED anymore,
     as it is impossible to retrieve their class object just by method object alone.
     """
-    locals_name = "<locals>"
-
     # Find the class which this method belongs too. We need this because on Python 3, unbound
     # methods are just regular functions with no reference to its class
-    names = method.__qualname__.split(".")
-    names.pop()
-    method_class = method.__globals__[names.pop(0)]
-    while names:
-        name = names.pop(0)
-        if name == locals_name:
-            raise NotImplementedError(
-                "Impossible to retrieve class object for "
-                "unbound methods in local classes."
-            )
+    qualname = method.__qualname__
+    if "<locals>" in qualname:
+        raise NotImplementedError(
+            "Impossible to retrieve class object for "
+            "unbound methods in local classes."
+        )
 
+    class_path, _, _ = qualname.rpartition(".")
+    names = iter(class_path.split("."))
+    method_class = method.__globals__[next(names)]
+    for name in names:
         method_class = getattr(method_class, name)
     return method_class
@@ -12,7 +12,7 @@ from typing import cast
 import warnings
 from collections.abc import Callable
 
-from oop_ext.foundation.is_frozen import IsDevelopment
+from oop_ext.foundation import is_frozen
 
 F = TypeVar("F", bound=Callable[..., Any])
 G = TypeVar("G", bound=Callable[..., Any])
@@ -45,18 +45,7 @@ def Override(method: G) -> Callable[[F], F]:
             pass
     """
 
-    def Wrapper(func: F) -> F:
-        if func.__name__ != method.__name__:
-            msg = "Wrong @Override: %r expected, but overwriting %r."
-            msg = msg % (func.__name__, method.__name__)
-            raise AssertionError(msg)
-
-        if func.__doc__ is None:
-            func.__doc__ = method.__doc__
-
-        return func
-
-    return Wrapper
+    return _MakeNameCheckWrapper("Override", method.__name__, method.__doc__)
 
 
 def Implements(method: G) -> Callable[[F], F]:
@@ -90,18 +79,30 @@ def Implements(method: G) -> Callable[[F], F]:
             pass
     """
 
-    def Wrapper(func: Callable) -> Callable:
-        if func.__name__ != method.__name__:
-            msg = "Wrong @Implements: %r expected, but overwriting %r."
-            msg = msg % (func.__name__, method.__name__)
-            raise AssertionError(msg)
+    return _MakeNameCheckWrapper("Implements", method.__name__, method.__doc__)
+
+
+def _MakeNameCheckWrapper(
+    decorator_name: str, expected_name: str, doc: str | None
+) -> Callable[[F], F]:
+    """
+    Creates the actual decorator used by :func:`Override` and :func:`Implements`, which only
+    captures the name and docstring of the target method (not the method itself).
+    """
+
+    def Wrapper(func: F) -> F:
+        if func.__name__ != expected_name:
+            raise AssertionError(
+                f"Wrong @{decorator_name}: {func.__name__!r} expected, "
+                f"but overwriting {expected_name!r}."
+            )
 
         if func.__doc__ is None:
-            func.__doc__ = method.__doc__
+            func.__doc__ = doc
 
         return func
 
-    return cast(Callable[[F], F], Wrapper)
+    return Wrapper
 
 
 def Deprecated(what: object | None = None) -> Callable[[F], F]:
@@ -112,41 +113,38 @@ def Deprecated(what: object | None = None) -> Callable[[F], F]:
         Method that replaces the deprecated method, if any. Here it is common to pass
         either a function or the name of the method.
     """
-    if not IsDevelopment():
+    if not is_frozen.IS_DEVELOPMENT:
         # Optimization: we don't want deprecated to add overhead in release mode.
+        return cast(Callable[[F], F], _DeprecatedNoOp)
 
-        def DeprecatedDecorator(func: Callable) -> Callable:
-            return func
-
-    else:
+    def DeprecatedDecorator(func: Callable) -> Callable:
+        """
+        The actual deprecated decorator, configured with the name parameter.
+        """
+        if what is not None:
+            msg = f"DEPRECATED: '{func.__name__}' is deprecated, use '{what}' instead"
+        else:
+            msg = f"DEPRECATED: '{func.__name__}' is deprecated"
 
-        def DeprecatedDecorator(func: Callable) -> Callable:
+        def DeprecatedWrapper(*args: object, **kwargs: object) -> object:
             """
-            The actual deprecated decorator, configured with the name parameter.
+            This method wrapper gives a deprecated message before calling the original
+            implementation.
             """
+            warnings.warn(msg, stacklevel=2)
+            return func(*args, **kwargs)
 
-            def DeprecatedWrapper(*args: object, **kwargs: object) -> object:
-                """
-                This method wrapper gives a deprecated message before calling the original
-                implementation.
-                """
-                if what is not None:
-                    msg = "DEPRECATED: '{}' is deprecated, use '{}' instead".format(
-                        func.__name__,
-                        what,
-                    )
-                else:
-                    msg = "DEPRECATED: '%s' is deprecated" % func.__name__
-                warnings.warn(msg, stacklevel=2)
-                return func(*args, **kwargs)
-
-            DeprecatedWrapper.__name__ = func.__name__
-            DeprecatedWrapper.__doc__ = func.__doc__
-            return DeprecatedWrapper
+        DeprecatedWrapper.__name__ = func.__name__
+        DeprecatedWrapper.__doc__ = func.__doc__
+        return DeprecatedWrapper
 
     return cast(Callable[[F], F], DeprecatedDecorator)
 
 
+def _DeprecatedNoOp(func: Callable) -> Callable:
+    return func
+
+
 def Abstract(func: F) -> F:
     '''
     Decorator to make methods 'abstract', which are meant to be overwritten in subclasses. If some
@@ -173,6 +171,8 @@ def Abstract(func: F) -> F:
 
     '''
 
+    msg_prefix = f"method {func.__name__!r} not implemented in class "
+
     # Make sure to use one of the valid general signatures accepted by AssertImplements
     # so this decorator can be used in interface implementations.
     def AbstractWrapper(self: object, *args: object, **kwargs: object) -> NoReturn:
@@ -182,10 +182,7 @@ def Abstract(func: F) -> F:
         """
         # # Unused argument args, kwargs
         # # pylint: disable-msg=W0613
-        msg = "method {} not implemented in class {}.".format(
-            repr(func.__name__), repr(self.__class__)
-        )
-        raise NotImplementedError(msg)
+        raise NotImplementedError(f"{msg_prefix}{self.__class__!r}.")
 
     # # Redefining build-in
     # # pylint: disable-msg=W0622
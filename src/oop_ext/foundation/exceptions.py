@@ -9,9 +9,13 @@ def ExceptionToUnicode(exception: Exception) -> str:
     since the original exception message is added into the new exception while Python 3 keeps the original exception
     as a separated attribute
     """
-    messages = []
-    exc: BaseException | None = exception
-    while exc:
+    exc: BaseException | None = exception.__cause__ or exception.__context__
+    if exc is None:
+        # Common case: no chained exceptions.
+        return str(exception)
+
+    messages = [str(exception)]
+    while exc is not None:
         messages.append(str(exc))
         exc = exc.__cause__ or exc.__context__
     return "\n".join(messages)
@@ -66,14 +66,10 @@ def AsImmutable(value: Any, return_str_if_not_expected: bool = True) -> Any:
     if value_class in _IMMUTABLE_TYPES:
         return value
 
-    if value_class == dict:
-        return ImmutableDict((i, AsImmutable(j)) for i, j in value.items())
-
-    if value_class in (tuple, list):
-        return tuple(AsImmutable(i) for i in value)
-
-    if value_class in (set, frozenset):
-        return frozenset(value)
+    # Exact container types are dispatched with a single dict lookup.
+    converter = _CONTAINER_CONVERTERS.get(value_class)
+    if converter is not None:
+        return converter(value)
 
     # Now, on to the isinstance series...
     if isinstance(value, int):
@@ -82,11 +78,8 @@ def AsImmutable(value: Any, return_str_if_not_expected: bool = True) -> Any:
     if isinstance(value, (float, str, bytes, bool)):
         return value
 
-    if isinstance(value, dict):
-        return ImmutableDict((i, AsImmutable(j)) for i, j in value.items())
-
-    if isinstance(value, (tuple, list)):
-        return tuple(AsImmutable(i) for i in value)
+    if isinstance(value, (dict, tuple, list)):
+        return _ContainerAsImmutable(value)
 
     if isinstance(value, (set, frozenset)):
         return frozenset(value)
@@ -98,6 +91,58 @@ def AsImmutable(value: Any, return_str_if_not_expected: bool = True) -> Any:
         raise RuntimeError("Cannot make %s immutable (not supported)." % value)
 
 
+def _ContainerAsImmutable(value: dict | tuple | list) -> Any:
+    """
+    Converts dicts to ImmutableDicts and tuples/lists to tuples, converting their items with
+    :func:`AsImmutable`.
+
+    Nested dicts/tuples/lists are walked with an explicit stack instead of recursion, so deeply
+    nested structures don't need one Python frame per level (nor hit the recursion limit).
+    """
+    stack = [_NewContainerFrame(value)]
+    while True:
+        frame = stack[-1]
+        children, converted, is_dict, _ = frame
+        for child in children:
+            if is_dict:
+                key, child = child
+            if child.__class__ in _IMMUTABLE_TYPES:
+                pass
+            elif isinstance(child, (dict, tuple, list)):
+                # Convert the child first, then come back to this container.
+                frame[3] = key if is_dict else None
+                stack.append(_NewContainerFrame(child))
+                break
+            else:
+                child = AsImmutable(child)
+            converted.append((key, child) if is_dict else child)
+        else:
+            stack.pop()
+            result = ImmutableDict(converted) if is_dict else tuple(converted)
+            if not stack:
+                return result
+            parent = stack[-1]
+            parent[1].append((parent[3], result) if parent[2] else result)
+
+
+def _NewContainerFrame(value: Any) -> list[Any]:
+    """
+    Stack frame used by :func:`_ContainerAsImmutable`:
+    [children iterator, converted children, is dict, key of the child being converted].
+    """
+    is_dict = isinstance(value, dict)
+    return [iter(value.items() if is_dict else value), [], is_dict, None]
+
+
+_CONTAINER_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    dict: _ContainerAsImmutable,
+    tuple: _ContainerAsImmutable,
+    list: _ContainerAsImmutable,
+    set: frozenset,
+    frozenset: frozenset,
+}
+
+
 class ImmutableDict(dict):
     """A hashable dict."""
 
@@ -123,12 +168,13 @@ class ImmutableDict(dict):
         raise NotImplementedError("dict is immutable")
 
     def __hash__(self) -> int:  # type:ignore[override]
-        if not hasattr(self, "_hash"):
-            # must be sorted (could give different results for dicts that should be the same
-            # if it's not).
-            self._hash = hash(tuple(sorted(self.items())))
-
-        return self._hash
+        try:
+            return self._hash
+        except AttributeError:
+            # Must not depend on the order of the items (dicts that compare equal may have
+            # been built in different orders).
+            self._hash: int = hash(frozenset(self.items()))
+            return self._hash
 
     def AsMutable(self) -> dict:
         """
@@ -188,19 +234,27 @@ class IdentityHashableRef(Generic[T]):
     ```
     """
 
+    __slots__ = ["_original", "_hash", "__weakref__"]
+
     _SENTINEL = object()
 
     def __init__(self, original: T):
         self._original = original
+        self._hash = id(original)
 
     def __eq__(self, other: object) -> bool:
+        if other.__class__ is IdentityHashableRef:
+            # Fast path for the usual case, avoiding the generic getattr.
+            return self._original is other._original  # type:ignore[attr-defined]
         return self._original is getattr(other, "_original", self._SENTINEL)
 
     def __ne__(self, other: object) -> bool:
+        if other.__class__ is IdentityHashableRef:
+            return self._original is not other._original  # type:ignore[attr-defined]
         return self._original is not getattr(other, "_original", self._SENTINEL)
 
     def __hash__(self) -> int:
-        return id(self._original)
+        return self._hash
 
     def __call__(self) -> T:
         return self._original
@@ -11,6 +11,10 @@ import sys
 
 _is_frozen = hasattr(sys, "frozen") and getattr(sys, "frozen")
 
+# Same value as IsFrozen(), as a module attribute for performance-sensitive code (always read it
+# through the module, as SetIsFrozen rebinds it).
+IS_FROZEN = _is_frozen
+
 
 def IsFrozen() -> bool:
     """
@@ -32,15 +36,19 @@ def SetIsFrozen(is_frozen: bool) -> bool:
     :returns bool:
         Returns the original value, before the given value is set.
     """
-    global _is_frozen
+    global _is_frozen, IS_FROZEN
     try:
         return _is_frozen
     finally:
-        _is_frozen = is_frozen
+        _is_frozen = IS_FROZEN = is_frozen
 
 
 _is_development = not _is_frozen
 
+# Same value as IsDevelopment(), as a module attribute for performance-sensitive code (always read
+# it through the module, as SetIsDevelopment rebinds it).
+IS_DEVELOPMENT = _is_development
+
 
 def IsDevelopment() -> bool:
     """
@@ -79,8 +87,8 @@ def SetIsDevelopment(is_development: bool) -> bool:
 
     So always mind this difference and think.
     """
-    global _is_development
+    global _is_development, IS_DEVELOPMENT
     try:
         return _is_development
     finally:
-        _is_development = is_development
+        _is_development = IS_DEVELOPMENT = is_development
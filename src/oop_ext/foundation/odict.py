@@ -19,7 +19,13 @@ class odict(collections.OrderedDict):
         Convenience method to have same interface as `ruamel.ordereddict`, which as traditionally
         used on Python 2.
         """
+        if index < 0:
+            # Negative indexes always inserted the key first (they are not counted from the end).
+            index = 0
+        is_new = key not in self
         self[key] = value
+        keys = list(self)
+        position = len(keys) - 1 if is_new else keys.index(key)
         # Determine which direction is cheaper to move items first. If new item is more to the left
         # of center, move items to its left to first, otherwise it is cheaper to move items to
         # right to last.
@@ -27,14 +33,16 @@ class odict(collections.OrderedDict):
         # Note that `move_to_end` is a O(1) operation that just swaps endpoints of underlying
         # double linked list maintained by C-extension ordered dict.
         moved: Iterable[Any]
-        if (len(self) - index) <= (len(self) // 2):
-            moved = [k for i, k in enumerate(self.keys()) if i >= index and k != key]
+        if (len(keys) - index) <= (len(keys) // 2):
+            moved = keys[index:]
+            if position >= index:
+                del moved[position - index]
             last = True
         else:
-            moved = reversed(
-                [k for i, k in enumerate(self.keys()) if i < index or k == key]
-            )
-
+            moved = keys[:index]
+            if position >= index:
+                moved.append(key)
+            moved = reversed(moved)
             last = False
         for k in moved:
             self.move_to_end(k, last=last)
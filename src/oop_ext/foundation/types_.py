@@ -18,6 +18,9 @@ class Method:
     (and its __call__ method is checked for the parameters)
     """
 
+    # Empty so subclasses are free to use __slots__ too.
+    __slots__ = ()
+
     __self__: object
     __name__: str
 
@@ -75,12 +78,25 @@ class Null:
     provided here.
     """
 
+    __slots__ = ["__weakref__"]
+
+    # So that __name__ is properly preserved in instances (instead of returning a Null).
+    __name__ = "Null"
+
+    # The single instance of Null (subclasses may have state, so they create new instances).
+    _instance: "Null"
+
     # object constructing
 
-    def __init__(self, *_args: object, **_kwargs: object) -> None:
-        "Ignore parameters."
-        # Setting the name of what's gotten (so that __name__ is properly preserved).
-        self.__dict__["_Null__name__"] = "Null"
+    def __new__(cls, *_args: object, **_kwargs: object) -> "Null":
+        "Ignore parameters: there's a single instance of Null itself."
+        if cls is not Null:
+            return object.__new__(cls)
+        try:
+            return Null._instance
+        except AttributeError:
+            instance = Null._instance = object.__new__(cls)
+            return instance
 
     def __call__(self, *_args: object, **_kwargs: object) -> "Null":
         "Ignore method calls."
@@ -93,9 +109,6 @@ class Null:
                 "No support for that (pickle causes error if it returns self in this case.)"
             )
 
-        if mname == "__name__":
-            return self.__dict__["_Null__name__"]
-
         return self
 
     def __setattr__(self, _name: str, _value: object) -> Any:
@@ -127,7 +140,7 @@ class Null:
 
     def __iter__(self) -> Iterator["Null"]:
         "I will stop it in the first iteration"
-        return iter([self])
+        return iter((self,))
 
     def __next__(self) -> NoReturn:
         "Stop the iteration right now"
@@ -135,7 +148,11 @@ class Null:
 
     def __eq__(self, o: Any) -> Any:
         "It is just equal to another Null object."
-        return self.__class__ == o.__class__
+        if o is self:
+            return True
+        if isinstance(o, Null):
+            return self.__class__ == o.__class__
+        return NotImplemented
 
     def __hash__(self) -> int:
         """Null is hashable"""
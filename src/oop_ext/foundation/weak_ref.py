@@ -8,10 +8,9 @@ from typing import Optional
 from typing import Set
 from typing import TypeVar
 from typing import Union
-from typing import cast
 from typing import overload
 
-import inspect
+import operator
 import weakref
 from collections.abc import Callable
 from collections.abc import Iterable
@@ -37,31 +36,62 @@ class WeakList(Generic[T]):
         https://github.com/apieum/weakreflist
     """
 
+    __slots__ = [
+        "data",
+        "_on_dead",
+        "_has_dead_refs",
+        "_has_foreign_refs",
+        "__weakref__",
+    ]
+
     def __init__(self, initlist: Iterable[T] | None = None):
         self.data: list[SomeWeakRef] = []
+        # Whether a reference in `data` died (set by `_on_dead`): dead references are then
+        # removed all at once the next time the list is accessed.
+        self._has_dead_refs = False
+        # Whether `data` may have references which are not created with `_on_dead` (shared with
+        # another list or given already as weak references), which must always be checked.
+        self._has_foreign_refs = False
+
+        def OnDead(ref: SomeWeakRef, self_ref: weakref.ref = weakref.ref(self)) -> None:
+            weak_list = self_ref()
+            if weak_list is not None:
+                weak_list._has_dead_refs = True
+
+        self._on_dead = OnDead
 
         if initlist is not None:
-            for x in initlist:
-                self.append(x)
+            self.extend(initlist)
 
     @Implements(list.append)
     def append(self, item: T) -> None:
-        self.data.append(GetWeakRef(item))
+        ref = GetWeakRef(item, self._on_dead)
+        if ref is item:
+            self._has_foreign_refs = True
+        self.data.append(ref)
 
     @Implements(list.extend)
     def extend(self, lst: Iterable[T]) -> None:
-        for o in lst:
-            self.append(o)
+        items = list(lst)
+        on_dead = self._on_dead
+        refs = [GetWeakRef(o, on_dead) for o in items]
+        if any(map(operator.is_, refs, items)):
+            self._has_foreign_refs = True
+        self.data.extend(refs)
 
     def __iter__(self) -> Iterator[T]:
-        # iterate in a copy
-        for ref in self.data[:]:
-            assert callable(ref), f"ref is not callable: {repr(ref)}"
-            d = ref()
-            if d is None:
-                self.data.remove(ref)
-            else:
-                yield d
+        dead_refs = []
+        try:
+            # iterate in a copy
+            for ref in self.data[:]:
+                d = ref()
+                if d is None:
+                    dead_refs.append(ref)
+                else:
+                    yield d
+        finally:
+            if dead_refs or self._has_dead_refs:
+                self._RemoveDeadRefs()
 
     def remove(self, item: T) -> None:
         """
@@ -73,25 +103,33 @@ class WeakList(Generic[T]):
         :param object item:
             The object to be removed.
         """
-        # iterate in a copy
+        found = False
+        alive = []
+        self._has_dead_refs = False
+        # iterate in a copy (references may be removed as their referents die)
         for ref in self.data[:]:
-            assert callable(ref), f"ref is not callable: {repr(ref)}"
             d = ref()
-
             if d is None:
-                self.data.remove(ref)
-
-            elif d == item:
-                self.data.remove(ref)
-                break
+                continue
+            if not found and d == item:
+                found = True
+                continue
+            alive.append(ref)
+        self.data[:] = alive
+
+    def _RemoveDeadRefs(self) -> None:
+        # Reset before checking, so references dying meanwhile are removed in the next call.
+        self._has_dead_refs = False
+        self.data[:] = [ref for ref in self.data if ref() is not None]
 
     def __len__(self) -> int:
-        i = 0
-        for _k in self:  # we make an iteration to remove dead references...
-            i += 1
-        return i
+        if self._has_dead_refs or self._has_foreign_refs:
+            self._RemoveDeadRefs()
+        return len(self.data)
 
     def __delitem__(self, i: int | slice) -> None:
+        if self._has_dead_refs:
+            self._RemoveDeadRefs()
         self.data.__delitem__(i)
 
     @overload
@@ -101,25 +139,29 @@ class WeakList(Generic[T]):
     def __getitem__(self, i: slice) -> "WeakList": ...
 
     def __getitem__(self, i: int | slice) -> Union[T | None, "WeakList"]:
+        if self._has_dead_refs:
+            self._RemoveDeadRefs()
         if isinstance(i, slice):
-            slice_ = []
-            for ref in self.data[i.start : i.stop : i.step]:
-                assert callable(ref), f"ref is not callable: {repr(ref)}"
-                d = ref()
-                if d is not None:
-                    slice_.append(d)
-
-            return WeakList(slice_)
+            # Reuse the live references instead of creating new ones for each object (dead
+            # references shared with this list are then only dropped lazily by the new one).
+            result: WeakList = WeakList()
+            result.data = [ref for ref in self.data[i] if ref() is not None]
+            result._has_foreign_refs = True
+            return result
         else:
             ref = self.data[i]
-            assert callable(ref), f"ref is not callable: {repr(ref)}"
             return ref()
 
     def __setitem__(self, i: int, item: T) -> None:
         """
         Set a weakref of item on the ith position
         """
-        self.data[i] = GetWeakRef(item)
+        if self._has_dead_refs:
+            self._RemoveDeadRefs()
+        ref = GetWeakRef(item, self._on_dead)
+        if ref is item:
+            self._has_foreign_refs = True
+        self.data[i] = ref
 
     def __str__(self) -> str:
         return "\n".join(str(x) for x in self)
@@ -136,26 +178,58 @@ class WeakMethodRef:
     Keeps a reference to an object but doesn't prevent that object from being garbage collected.
     """
 
-    __slots__ = ["_obj", "_func", "_class", "_hash", "__weakref__"]
+    __slots__ = ["_obj", "_obj_id", "_func", "_class", "_hash", "__weakref__"]
 
-    def __init__(self, method: Any):
+    def __init__(
+        self,
+        method: Any,
+        callback: Callable[["WeakMethodRef"], object] | None = None,
+    ):
+        """
+        :param callback:
+            If given, called with this reference when the instance of the bound method dies
+            (just like the callback of ``weakref.ref``).
+        """
         self._obj: weakref.ReferenceType | None
-        try:
-            if method.__self__ is not None:
-                # bound method
-                self._obj = weakref.ref(method.__self__)
-            else:
+        self._obj_id: int | None
+        func = getattr(method, "__func__", None)
+        if func is not None and hasattr(method, "__self__"):
+            method_self = method.__self__
+            if method_self is None:
                 # unbound method
                 self._obj = None
-            self._func = method.__func__
-            self._class = method.__self__.__class__
-        except AttributeError:
+            elif callback is None:
+                # bound method
+                self._obj = weakref.ref(method_self)
+            else:
+                self._obj = weakref.ref(
+                    method_self, _MakeWeakMethodRefCallback(self, callback)
+                )
+            # Kept to compare references after the object dies.
+            self._obj_id = id(method_self)
+            self._func = func
+            self._class = method_self.__class__
+        else:
             # not a method -- a callable: create a strong reference (the CallbackWrapper
             # is depending on this behaviour... is it correct?)
             self._obj = None
+            self._obj_id = None
             self._func = method
             self._class = None
 
+        # The hash should be immutable (must be calculated once and never changed -- otherwise
+        # we won't be able to get it when the object dies), so calculate it while it's alive.
+        # A bound method is hashed directly, as it is equal to the one __call__ would create.
+        try:
+            if type(method) is MethodType:
+                self._hash = hash(method)
+            else:
+                self._hash = hash(WeakMethodRef.__call__(self))
+        except Exception:
+            # Unhashable callable (or one whose __hash__ fails): __hash__ raises (only if
+            # actually called).
+            pass
+
     def __call__(self) -> Any:
         """
         Return a new bound-method like the original, or the original function if refers just to
@@ -164,14 +238,15 @@ class WeakMethodRef:
         @return:
             None if the original object doesn't exist anymore.
         """
-        if self.is_dead():
-            return None
-        if self._obj is not None:
-            # we have an instance: return a bound method
-            return MethodType(self._func, self._obj())
-        else:
+        obj_ref = self._obj
+        if obj_ref is None:
             # we don't have an instance: return just the function
             return self._func
+        obj = obj_ref()
+        if obj is None:
+            return None
+        # we have an instance: return a bound method
+        return MethodType(self._func, obj)
 
     def is_dead(self) -> bool:
         """Returns True if the referenced callable was a bound method and
@@ -180,26 +255,32 @@ class WeakMethodRef:
         return self._obj is not None and self._obj() is None
 
     def __eq__(self, other: object) -> bool:
-        try:
+        if type(self) is not type(other):
+            return False
+        func = WeakMethodRef.__call__(self)
+        other_func = WeakMethodRef.__call__(other)  # type:ignore[arg-type]
+        if func is None and other_func is None:
+            # Both dead: compare the identity of the objects they referred to, so dead references
+            # to different objects (which have different hashes) are not equal.
             return (
-                type(self) is type(other) and self() == other()  # type:ignore[operator]
+                self._obj_id == other._obj_id  # type:ignore[attr-defined]
+                and self._func == other._func  # type:ignore[attr-defined]
             )
-        except:
-            return False
+        return func == other_func
 
     def __ne__(self, other: object) -> bool:
         return not self == other
 
     def __hash__(self) -> int:
-        if not hasattr(self, "_hash"):
-            # The hash should be immutable (must be calculated once and never changed -- otherwise
-            # we won't be able to get it when the object dies)
-            self._hash = hash(WeakMethodRef.__call__(self))
-
-        return self._hash
+        try:
+            return self._hash
+        except AttributeError:
+            return hash(WeakMethodRef.__call__(self))
 
     def __repr__(self) -> str:
-        func_name = getattr(self._func, "__name__", str(self._func))
+        func_name = getattr(self._func, "__name__", None)
+        if func_name is None:
+            func_name = str(self._func)
         if self._obj is not None:
             obj = self._obj()
             if obj is None:
@@ -212,6 +293,23 @@ class WeakMethodRef:
             return "<WeakMethodRef to %s>" % func_name
 
 
+def _MakeWeakMethodRefCallback(
+    method_ref: WeakMethodRef, callback: Callable[[WeakMethodRef], object]
+) -> Callable[[weakref.ReferenceType], None]:
+    """
+    Adapts a callback for the weak reference to the instance of a bound method, so it's called
+    with the WeakMethodRef itself (only kept as a weak reference to avoid a cycle).
+    """
+    method_ref_ref = weakref.ref(method_ref)
+
+    def OnDead(_ref: weakref.ReferenceType) -> None:
+        method_ref = method_ref_ref()
+        if method_ref is not None:
+            callback(method_ref)
+
+    return OnDead
+
+
 class WeakMethodProxy(WeakMethodRef):
     """
     Like ref, but calling it will cause the referent method to be called with the same
@@ -222,19 +320,17 @@ class WeakMethodProxy(WeakMethodRef):
         return WeakMethodRef.__call__(self)
 
     def __call__(self, *args: object, **kwargs: object) -> Any:
-        func = WeakMethodRef.__call__(self)
-        if func is None:
+        # Same as calling WeakMethodRef.__call__(self), but without creating a bound method.
+        obj_ref = self._obj
+        if obj_ref is None:
+            return self._func(*args, **kwargs)
+        obj = obj_ref()
+        if obj is None:
             raise ReferenceError(f"Object is dead. Was of class: {self._class}")
-        else:
-            return func(*args, **kwargs)
+        return self._func(obj, *args, **kwargs)
 
     def __eq__(self, other: object) -> bool:
-        try:
-            func1 = WeakMethodRef.__call__(self)
-            func2 = WeakMethodRef.__call__(other)  # type:ignore[arg-type]
-            return type(self) == type(other) and func1 == func2
-        except:
-            return False
+        return WeakMethodRef.__eq__(self, other)
 
 
 class WeakSet(Generic[T]):
@@ -248,22 +344,40 @@ class WeakSet(Generic[T]):
     ..see:: weakref.WeakSet
     """
 
+    __slots__ = ["data", "_on_dead", "_has_foreign_refs", "__weakref__"]
+
     def __init__(self) -> None:
         self.data: set[SomeWeakRef] = set()
+        # Whether `data` may have references which are not removed by `_on_dead` (shared with
+        # another set or given already as weak references), so __len__ must check them.
+        self._has_foreign_refs = False
+
+        def OnDead(ref: SomeWeakRef, self_ref: weakref.ref = weakref.ref(self)) -> None:
+            weak_set = self_ref()
+            if weak_set is not None:
+                weak_set.data.discard(ref)
+
+        # Removes references as soon as their referents die (iterating still checks for dead
+        # references, as copies share references created with the callback of the original).
+        self._on_dead = OnDead
 
     def add(self, item: T) -> None:
-        self.data.add(GetWeakRef(item))
+        ref = GetWeakRef(item, self._on_dead)
+        if ref is item:
+            self._has_foreign_refs = True
+        self.data.add(ref)
 
     def clear(self) -> None:
         self.data.clear()
+        self._has_foreign_refs = False
 
     def __iter__(self) -> Iterator[T]:
-        # iterate in a copy
-        for ref in self.data.copy():
-            assert callable(ref), f"ref is not callable: {repr(ref)}"
+        # Iterate in a snapshot, as references are removed by their callbacks when items die.
+        for ref in list(self.data):
             d = ref()
             if d is None:
-                self.data.remove(ref)
+                # Only references in `_has_foreign_refs` may still be here.
+                self.data.discard(ref)
             else:
                 yield d
 
@@ -278,6 +392,11 @@ class WeakSet(Generic[T]):
 
     def union(self, another_set: Iterable[T]) -> "WeakSet":
         result = WeakSet[T]()
+        result._has_foreign_refs = True
+        if isinstance(another_set, WeakSet):
+            # Both already hold weak references: no need to dereference and wrap them again.
+            result.data = self.data | another_set.data
+            return result
         result.data = self.data.copy()
         for i in another_set:
             result.add(i)
@@ -286,13 +405,16 @@ class WeakSet(Generic[T]):
     def copy(self) -> "WeakSet[T]":
         result = WeakSet[T]()
         result.data = self.data.copy()
+        result._has_foreign_refs = True
         return result
 
     def __sub__(self, another_set: Iterable[T]) -> "WeakSet":
         result = WeakSet[T]()
-        result.data = self.data.copy()
-        for i in another_set:
-            result.discard(i)
+        result._has_foreign_refs = True
+        if isinstance(another_set, WeakSet):
+            result.data = self.data - another_set.data
+        else:
+            result.data = self.data.difference([GetWeakRef(i) for i in another_set])
         return result
 
     def __rsub__(self, another_set: Any) -> Any:
@@ -308,29 +430,30 @@ class WeakSet(Generic[T]):
             pass
 
     def __len__(self) -> int:
-        i = 0
-        for _k in self:  # we make an iteration to remove dead references...
-            i += 1
-        return i
+        if self._has_foreign_refs:
+            self.data.difference_update([ref for ref in self.data if ref() is None])
+        return len(self.data)
 
     def __str__(self) -> str:
         return "\n".join(str(x) for x in self)
 
 
+_WEAK_PROXY_TYPES = (weakref.ProxyType, weakref.CallableProxyType, WeakMethodProxy)
+_WEAK_REF_TYPES = (weakref.ReferenceType, WeakMethodRef)
+
+
 def IsWeakProxy(obj: object) -> bool:
     """
     Returns whether the given object is a weak-proxy
     """
-    return isinstance(obj, (weakref.ProxyType, WeakMethodProxy))
+    return isinstance(obj, _WEAK_PROXY_TYPES)
 
 
 def IsWeakRef(obj: object) -> bool:
     """
     Returns wheter ths given object is a weak-reference.
     """
-    return isinstance(obj, (weakref.ReferenceType, WeakMethodRef)) and not isinstance(
-        obj, WeakMethodProxy
-    )
+    return isinstance(obj, _WEAK_REF_TYPES) and not isinstance(obj, WeakMethodProxy)
 
 
 def IsWeakObj(obj: object) -> bool:
@@ -364,12 +487,12 @@ def GetWeakProxy(obj: Any) -> Any:
     if obj is None:
         return None
 
-    if not IsWeakProxy(obj):
-        if IsWeakRef(obj):
+    if not isinstance(obj, _WEAK_PROXY_TYPES):
+        if isinstance(obj, _WEAK_REF_TYPES):  # WeakMethodProxy was excluded above
             obj = obj()
 
         # for methods we cannot create regular weak-refs
-        if inspect.ismethod(obj):
+        if isinstance(obj, MethodType):
             return WeakMethodProxy(obj)
 
         return weakref.proxy(obj)
@@ -381,26 +504,69 @@ def GetWeakProxy(obj: Any) -> Any:
 _NONE_REF = WeakMethodRef(None)
 
 
-def GetWeakRef(obj: T) -> SomeWeakRef:
+def GetWeakRef(obj: T, callback: Callable[[Any], object] | None = None) -> SomeWeakRef:
     """
     :type obj: this is the object we want to get as a weak ref
     :param obj:
+    :param callback:
+        If given, called with the returned reference when the object dies (just like the callback
+        of ``weakref.ref``). Ignored if ``obj`` is None or already a weak reference.
     @return the object as a proxy (if it is still not already a proxy or a weak ref, in which case the passed
                                    object is returned itself)
     """
     if obj is None:
         return _NONE_REF
 
-    if IsWeakProxy(obj):
+    make_weak_ref = _MAKE_WEAK_REF_BY_TYPE_ID.get(id(type(obj)))
+    if make_weak_ref is None:
+        make_weak_ref = _CacheMakeWeakRef(obj)
+    return make_weak_ref(obj, callback)
+
+
+def _GetMakeWeakRef(obj: object) -> Callable[[Any, Any], SomeWeakRef]:
+    """
+    Returns how GetWeakRef should get the weak reference for objects of the type of ``obj``.
+    """
+    if isinstance(obj, _WEAK_PROXY_TYPES):
         raise RuntimeError("Unable to get weak ref for proxy.")
 
-    if not IsWeakRef(obj):
-        # for methods we cannot create regular weak-refs
-        if inspect.ismethod(obj):
-            return WeakMethodRef(obj)
+    if isinstance(obj, _WEAK_REF_TYPES):
+        return _AlreadyWeakRef
 
-        return weakref.ref(obj)
-    return cast(ReferenceType, obj)
+    # for methods we cannot create regular weak-refs
+    if isinstance(obj, MethodType):
+        return WeakMethodRef
+
+    return weakref.ref
+
+
+def _AlreadyWeakRef(obj: SomeWeakRef, callback: object) -> SomeWeakRef:
+    return obj
+
+
+def _CacheMakeWeakRef(obj: object) -> Callable[[Any, Any], SomeWeakRef]:
+    """
+    Caches the result of _GetMakeWeakRef for the exact type of ``obj``.
+
+    The cache is keyed by the id of the type (and the entry is removed when the type dies), so
+    types which are created dynamically are not kept alive by it.
+    """
+    make_weak_ref = _GetMakeWeakRef(obj)
+    type_id = id(type(obj))
+
+    def OnTypeDead(ref: weakref.ref) -> None:
+        _MAKE_WEAK_REF_BY_TYPE_ID.pop(type_id, None)
+        _TYPE_REFS.pop(type_id, None)
+
+    _TYPE_REFS[type_id] = weakref.ref(type(obj), OnTypeDead)
+    _MAKE_WEAK_REF_BY_TYPE_ID[type_id] = make_weak_ref
+    return make_weak_ref
+
+
+# Cache of _GetMakeWeakRef by exact type, so GetWeakRef doesn't need to do the isinstance checks
+# again for objects of a type already seen.
+_MAKE_WEAK_REF_BY_TYPE_ID: dict[int, Callable[[Any, Any], SomeWeakRef]] = {}
+_TYPE_REFS: dict[int, weakref.ref] = {}
 
 
 def IsSame(o1: Any, o2: Any) -> bool:
@@ -416,6 +582,10 @@ def IsSame(o1: Any, o2: Any) -> bool:
     @raise
         RuntimeError if both of the passed parameters are weak references
     """
+    if o1 is o2:
+        # Same object, no matter if it's weak or not.
+        return True
+
     # get rid of weak refs (we only need special treatment for proxys)
     if IsWeakRef(o1):
         o1 = o1()
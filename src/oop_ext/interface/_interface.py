@@ -36,6 +36,8 @@ AssertImplements(impl, IMyCalculator)
 
 
 """
+from types import FunctionType
+from types import MethodType
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
@@ -53,15 +55,15 @@ from typing import cast
 
 import inspect
 import sys
+import weakref
 from collections.abc import Callable
 from collections.abc import Sequence
-from contextlib import suppress
 from functools import lru_cache
 
-from oop_ext.foundation.cached_method import ImmutableParamsCachedMethod
+from oop_ext.foundation import is_frozen
 from oop_ext.foundation.decorators import Deprecated
-from oop_ext.foundation.is_frozen import IsDevelopment
 from oop_ext.foundation.types_ import Method
+from oop_ext.foundation.types_ import Null
 
 if TYPE_CHECKING:
     from traceback import StackSummary
@@ -108,8 +110,9 @@ InterfaceType = type[Any]
 class InterfaceImplementationMetaClass(type):
     def __new__(cls, name: str, bases: tuple, dct: dict) -> Any:
         C = type.__new__(cls, name, bases, dct)
-        if IsDevelopment():  # Only doing check in dev mode.
-            for I in dct.get("__implements__", []):
+        implements = dct.get("__implements__")
+        if implements and is_frozen.IS_DEVELOPMENT:  # Only doing check in dev mode.
+            for I in implements:
                 # Will do full checking this first time, and also cache the results
                 AssertImplements(C, I)
         return C
@@ -126,14 +129,26 @@ class InterfaceImplementorStub(Generic[T]):
     It forwards the calls to the actual implementor (the wrapped object)
     """
 
+    __slots__ = [
+        "__wrapped",
+        "__implemented_interface",
+        "__interface_methods",
+        "__attr_names",
+        "__weakref__",
+    ]
+
     def __init__(self, wrapped: T, implemented_interface: type["Interface"]) -> None:
         self.__wrapped = wrapped
         self.__implemented_interface = implemented_interface
 
-        (
-            self.__interface_methods,
-            self.__attrs,
-        ) = cache_interface_attrs.GetInterfaceMethodsAndAttrs(implemented_interface)
+        # The members are stored in the interface itself, as stubs are created for every
+        # Interface(obj) call (looked up in its own namespace, so subclasses don't inherit them).
+        try:
+            members = vars(implemented_interface)[_STUB_MEMBERS_ATTR]
+        except KeyError:
+            members = _GetStubMembers(implemented_interface)
+            setattr(implemented_interface, _STUB_MEMBERS_ATTR, members)
+        self.__interface_methods, self.__attr_names = members
 
     def GetWrappedFromImplementorStub(self) -> T:
         """
@@ -142,7 +157,11 @@ class InterfaceImplementorStub(Generic[T]):
         return self.__wrapped
 
     def __getattr__(self, attr: str) -> Any:
-        if attr not in self.__attrs and attr not in self.__interface_methods:
+        if attr not in self.__attr_names:
+            if attr.startswith("__") and attr.endswith("__"):
+                # Special names are probed often (hasattr, copy, pickle...): skip formatting
+                # the message for those.
+                raise AttributeError(attr)
             raise AttributeError(
                 "Error. The interface {} does not have the attribute '{}' declared.".format(
                     self.__implemented_interface, attr
@@ -181,6 +200,22 @@ class InterfaceImplementorStub(Generic[T]):
         return self.__wrapped.__call__(*args, **kwargs)  # type:ignore[operator]
 
 
+def _GetStubMembers(
+    interface: InterfaceType,
+) -> tuple[dict[str, Any], frozenset[str]]:
+    """
+    :rtype: the methods of the given interface and the names of all its methods and attributes.
+    """
+    interface_methods, interface_attrs = (
+        cache_interface_attrs.GetInterfaceMethodsAndAttrs(interface)
+    )
+    return interface_methods, frozenset(interface_methods).union(interface_attrs)
+
+
+# Name of the interface attribute where the result of _GetStubMembers is stored.
+_STUB_MEMBERS_ATTR = "_InterfaceImplementorStub__members"
+
+
 # Instance to check if we are receiving an argument during Interface.__new__
 _SENTINEL = object()
 
@@ -230,8 +265,6 @@ class Interface(TypeCheckingSupport):
         """
         # if no class is given, raise InterfaceError('trying to instantiate interface')
         # check if class_or_object implements this interface
-        from ._adaptable_interface import IAdaptable
-
         if class_ is _SENTINEL:
             raise InterfaceError("Can't instantiate Interface.")
         else:
@@ -242,12 +275,17 @@ class Interface(TypeCheckingSupport):
             elif isinstance(class_, InterfaceImplementorStub):
                 return class_
             else:
-                implemented_interfaces = GetImplementedInterfaces(class_)
+                # An instance: go straight to the (cached) interfaces of its class.
+                implemented_interfaces = _GetClassImplementedInterfaces(
+                    class_.__class__
+                )
 
                 if cls in implemented_interfaces:
                     return InterfaceImplementorStub(class_, cls)
 
-                elif IAdaptable in implemented_interfaces:
+                from ._adaptable_interface import IAdaptable
+
+                if IAdaptable in implemented_interfaces:
                     adapter = class_.GetAdapter(cls)
                     if adapter is not None:
                         return InterfaceImplementorStub(adapter, cls)
@@ -424,9 +462,31 @@ def AssertImplements(
     assert is_implementation, reason
 
 
-# Using explicit memoization, because we need to forget some values at some times
-__ImplementsCache: dict[tuple[type, InterfaceType, bool], tuple[bool, str | None]] = {}
-__ImplementedInterfacesCache: dict[type, frozenset[InterfaceType]] = {}
+# Using explicit memoization, because we need to forget some values at some times.
+# The caches are keyed by the id of the class (see _TrackClass), so that classes which are created
+# dynamically are not kept alive by them.
+__ImplementsCache: dict[
+    int, dict[tuple[InterfaceType, bool], tuple[bool, str | None]]
+] = {}
+__ImplementedInterfacesCache: dict[int, frozenset[InterfaceType]] = {}
+__ClassRefs: dict[int, weakref.ref] = {}
+
+
+def _TrackClass(class_: type) -> None:
+    """
+    Makes sure the cached results for the given class are removed when the class dies (before
+    its id can be reused).
+    """
+    class_id = id(class_)
+    if class_id in __ClassRefs:
+        return
+
+    def OnClassDead(ref: weakref.ref) -> None:
+        __ImplementsCache.pop(class_id, None)
+        __ImplementedInterfacesCache.pop(class_id, None)
+        __ClassRefs.pop(class_id, None)
+
+    __ClassRefs[class_id] = weakref.ref(class_, OnClassDead)
 
 
 def _CheckIfClassImplements(
@@ -448,16 +508,18 @@ def _CheckIfClassImplements(
         If the class doesn't implement the given interface, will return False, and a message stating
         the reason (missing methods, etc.). The message may be None.
     """
-    with suppress(KeyError):
-        return __ImplementsCache[(class_, interface, requires_declaration)]
+    cache_key = (interface, requires_declaration)
+    class_results = __ImplementsCache.get(id(class_))
+    if class_results is not None:
+        cached = class_results.get(cache_key)
+        if cached is not None:
+            return cached
 
     assert _IsClass(class_)
 
     is_implementation = True
     reason = None
     # Exception: Null implements every Interface (useful for Null Object Pattern and for testing)
-    from oop_ext.foundation.types_ import Null
-
     if not issubclass(class_, Null):
         try:
             _AssertImplementsFullChecking(class_, interface, check_attr=False)
@@ -479,7 +541,8 @@ def _CheckIfClassImplements(
         )
 
     result = (is_implementation, reason)
-    __ImplementsCache[(class_, interface, requires_declaration)] = result
+    _TrackClass(class_)
+    __ImplementsCache.setdefault(id(class_), {})[cache_key] = result
     return result
 
 
@@ -523,17 +586,12 @@ def _IsInterfaceDeclared(class_: type | None, interface: InterfaceType) -> bool:
 
     _CheckIsInterfaceSubclass(interface)
 
+    # The declared interfaces already include all the interfaces they subclass (only `Interface`
+    # itself is left out, which is declared as long as any interface is).
     declared_interfaces = GetImplementedInterfaces(class_)
-
-    # This set will include all interfaces (and its subclasses) declared for the given object
-    declared_and_subclasses: set[type] = set()
-    for implemented in declared_interfaces:
-        declared_and_subclasses.update(implemented.__mro__)
-
-    # Discarding object (it will always be returned in the mro collection)
-    declared_and_subclasses.discard(object)
-
-    return interface in declared_and_subclasses
+    if interface is Interface:
+        return bool(declared_interfaces)
+    return interface in declared_interfaces
 
 
 if not TYPE_CHECKING:
@@ -541,6 +599,8 @@ if not TYPE_CHECKING:
     class Attribute:
         """ """
 
+        __slots__ = ["attribute_type", "instance"]
+
         _do_not_check_instance = object()
 
         def __init__(
@@ -602,6 +662,8 @@ if not TYPE_CHECKING:
         the related property should be also declared as read-only).
         """
 
+        __slots__ = ()
+
 else:
     # Type checking interfaces for Attribute and ReadOnlyAttribute: they
     # should be considered simple wrappers by the type checker, as that are handled
@@ -634,6 +696,9 @@ class CacheInterfaceAttrs:
         "__native__",
     )
 
+    def __init__(self) -> None:
+        self._cache: dict[InterfaceType, tuple[dict[str, Any], dict[str, Any]]] = {}
+
     @classmethod
     def RegisterAttributeClass(
         cls: type["CacheInterfaceAttrs"], attribute_class: type[object]
@@ -667,18 +732,16 @@ class CacheInterfaceAttrs:
 
         interface_methods = dict()
         interface_attrs = dict()
-        interface_vars = vars(interface)
 
         # Python 3+ changed how functions are represented, so it isn't possible anymore to
         # determine if a function is a method BEFORE it is bound to an object.
         # For this reason, it is necessary to also search by functions on Python and to filter out
         # functions like `__new__`, which are part of `Interface` class implementation and not part
-        # expected interface.
+        # expected interface (unless the interface itself declares them).
+        reserved_names = self.INTERFACE_OWN_METHODS.difference(vars(interface))
         for attr in all_attrs:
-            # If name inherited from `Interface`, check if isn't in list of reserved names
-            if attr not in interface_vars:
-                if attr in self.INTERFACE_OWN_METHODS:
-                    continue
+            if attr in reserved_names:
+                continue
 
             val = getattr(interface, attr)
 
@@ -690,27 +753,21 @@ class CacheInterfaceAttrs:
 
         return interface_methods, interface_attrs
 
-    cache: ImmutableParamsCachedMethod
-
     def GetInterfaceMethodsAndAttrs(
         self, interface: InterfaceType
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
-        We have to make the creation of the ImmutableParamsCacheManager lazy because
-        otherwise we'd enter a cyclic import.
-
         :type interface: the interface from where the methods and attributes should be gotten
         :param interface:
             (used as the cache-key)
         :rtype: @see: CacheInterfaceAttrs.__GetInterfaceMethodsAndAttrs
         """
-        try:
-            cache = self.cache
-        except AttributeError:
-            cache = self.cache = ImmutableParamsCachedMethod(
-                self.__GetInterfaceMethodsAndAttrs
+        result = self._cache.get(interface)
+        if result is None:
+            result = self._cache[interface] = self.__GetInterfaceMethodsAndAttrs(
+                interface
             )
-        return cache(interface)
+        return result
 
 
 # cache for the interface attrs (for Methods and Attrs).
@@ -725,14 +782,13 @@ def _IsMethod(member: object) -> bool:
         3) instances of Method (should it be implementors of "IMethod"?)
 
     """
+    member_type = type(member)
+    if member_type is FunctionType or member_type is MethodType:
+        return True
+
     from unittest import mock
 
-    return (
-        inspect.isfunction(member)
-        or inspect.ismethod(member)
-        or isinstance(member, Method)
-        or isinstance(member, mock.MagicMock)
-    )
+    return isinstance(member, (Method, mock.MagicMock))
 
 
 @Deprecated(AssertImplements)
@@ -762,9 +818,6 @@ def _AssertImplementsFullChecking(
     :raises BadImplementationError:
         If :arg class_or_instance: doesn't implement this interface.
     """
-    # Moved from the file to avoid cyclic import:
-    from oop_ext.foundation.types_ import Null
-
     _CheckIsInterfaceSubclass(interface)
 
     if isinstance(class_or_instance, Null):
@@ -800,27 +853,6 @@ def _AssertImplementsFullChecking(
                 msg = msg % (attr_name, class_or_instance, interface)
                 raise BadImplementationError(msg)
 
-    def GetSignature(method: Any) -> inspect.Signature:
-        """
-        Get the inspect.Signature object for the method, considering the possibility of instances of Method,
-        in which case, we must obtain the arguments of the instance "__call__" method.
-
-        The returned signature is also stripped of any type annotation information, as we don't want to
-        check them at runtime.
-        """
-        if isinstance(method, Method):
-            signature = inspect.signature(type(method).__call__)
-        else:
-            signature = inspect.signature(method)
-
-        new_parameters = [
-            p.replace(annotation=inspect.Signature.empty)
-            for p in signature.parameters.values()
-        ]
-        return signature.replace(
-            parameters=new_parameters, return_annotation=inspect.Signature.empty
-        )
-
     acceptable_impl_signatures = _GetGenericImplementationSignatures()
 
     class_ = _GetClassForInterfaceChecking(class_or_instance)
@@ -828,12 +860,8 @@ def _AssertImplementsFullChecking(
     for name in interface_methods:
         if name in _INTERFACE_METHODS_TO_IGNORE:
             continue
-        try:
-            cls_or_obj_method = getattr(class_or_instance, name)
-            if not _IsMethod(cls_or_obj_method):
-                raise AttributeError
-
-        except AttributeError:
+        cls_or_obj_method = getattr(class_or_instance, name, _SENTINEL)
+        if cls_or_obj_method is _SENTINEL or not _IsMethod(cls_or_obj_method):
             msg = "Method %r is missing in class %r (required by interface %r)"
             raise BadImplementationError(msg % (name, classname, interface.__name__))
         else:
@@ -843,7 +871,7 @@ def _AssertImplementsFullChecking(
             # doesn't include "self"
             cls_method = getattr(class_, name)
 
-            impl_sig = GetSignature(cls_method)
+            impl_sig = _GetSignature(cls_method)
 
             try:
                 hash(impl_sig)
@@ -855,7 +883,7 @@ def _AssertImplementsFullChecking(
             if impl_sig in acceptable_impl_signatures:
                 continue
 
-            interface_sig = GetSignature(interface_method)
+            interface_sig = _GetSignature(interface_method)
 
             if interface_sig != impl_sig:
                 msg = (
@@ -868,6 +896,50 @@ def _AssertImplementsFullChecking(
                 raise BadImplementationError(msg)
 
 
+def _GetSignature(method: Any) -> inspect.Signature:
+    """
+    Get the inspect.Signature object for the method, considering the possibility of instances of Method,
+    in which case, we must obtain the arguments of the instance "__call__" method.
+
+    The returned signature is also stripped of any type annotation information, as we don't want to
+    check them at runtime.
+    """
+    if isinstance(method, Method):
+        method = type(method).__call__
+    return _GetSignatureWithoutAnnotations(method)
+
+
+# Cache of the signatures of functions (weak, so they don't keep functions and their classes
+# alive), as the signatures of interface methods are needed for every class checked against it.
+_SIGNATURES_CACHE: weakref.WeakKeyDictionary[FunctionType, inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _GetSignatureWithoutAnnotations(method: Any) -> inspect.Signature:
+    """
+    Cached for plain functions only: bound methods are created on each access and would keep
+    their instance (or class) alive.
+    """
+    if type(method) is FunctionType:
+        try:
+            return _SIGNATURES_CACHE[method]
+        except KeyError:
+            pass
+
+    signature = inspect.signature(method)
+    new_parameters = [
+        p.replace(annotation=inspect.Signature.empty)
+        for p in signature.parameters.values()
+    ]
+    result = signature.replace(
+        parameters=new_parameters, return_annotation=inspect.Signature.empty
+    )
+    if type(method) is FunctionType:
+        _SIGNATURES_CACHE[method] = result
+    return result
+
+
 DEBUG = False
 
 
@@ -884,78 +956,88 @@ def ImplementsInterface(*interfaces: Any, no_check: bool = False) -> Callable[[T
         If ``True``, does not check if the class implements the declared interfaces
         during import time.
     """
-    called = [False]
-
-    class Check:
-        def __init__(self) -> None:
-            def _OnDie(ref: Any) -> None:
-                # We may just use warnings.warn in the future, after our
-                # codebase is properly 'sanitized', instead of handle_exception.
-                #
-                # This is to prevent users of doing an ImplementsInterface()
-                # without using it as a decorator.
-                if not called[0]:
-                    created_at_line: Union[str, "StackSummary"]
-                    if not DEBUG:
-                        created_at_line = (
-                            "\nSet DEBUG == True in: {} to see location.".format(
-                                __file__
-                            )
-                        )
-                    else:
-                        # This may be slow, so, just do it if DEBUG is enabled.
-                        import traceback
-
-                        created_at_line = traceback.extract_stack(
-                            sys._getframe(), limit=10
-                        )
-
-                    if isinstance(created_at_line, str):
-                        created_at_str = created_at_line
-                    else:
-                        created_at_str = "".join(traceback.format_list(created_at_line))
-
-                    raise AssertionError(
-                        "A call with ImplementsInterface({}) was not properly done as a class decorator.\nCreated at: {}".format(
-                            ", ".join(
-                                tuple(
-                                    str(getattr(x, "__name__", x)) for x in interfaces
-                                )
-                            ),
-                            created_at_str,
-                        )
-                    )
+    return _ImplementsInterfaceDecorator(interfaces, no_check)
+
+
+class _ImplementsInterfaceDecorator:
+    """
+    The class decorator returned by ImplementsInterface.
+    """
 
-            import weakref
+    __slots__ = ["_interfaces", "_no_check", "_called", "_ref", "__weakref__"]
+
+    def __init__(self, interfaces: tuple[Any, ...], no_check: bool) -> None:
+        self._interfaces = interfaces
+        self._no_check = no_check
+        self._called = [False]
+        if is_frozen.IS_DEVELOPMENT:
+            # Only checking that it's actually used as a decorator in dev mode (this is done for
+            # every decorated class).
+            self._ref = weakref.ref(
+                self, _MakeImplementsInterfaceOnDie(interfaces, self._called)
+            )
+
+    def __call__(self, type_: T) -> T:
+        self._called[0] = True
+        interfaces = self._interfaces
+        # The current interfaces may be a list (see DeclareClassImplements).
+        curr = getattr(type_, "__implements__", ())
+        type_.__implements__ = (  # type:ignore[attr-defined]
+            tuple(curr) + interfaces if curr else interfaces
+        )
 
-            self._ref = weakref.ref(self, _OnDie)
+        if not self._no_check:
+            if is_frozen.IS_DEVELOPMENT:  # Only doing check in dev mode.
+                for I in interfaces:
+                    # Will do full checking this first time, and also cache the results
+                    AssertImplements(type_, I)
 
-        def __call__(self, type_: T) -> T:
-            called[0] = True
-            namespace = type_
-            curr = getattr(namespace, "__implements__", None)
-            if curr is not None:
-                all_interfaces = curr + interfaces
+        return type_
+
+    def __bool__(self) -> NoReturn:
+        self._called[0] = True
+        raise RuntimeError(
+            "Invalid attempt to test interface.ImplementsInterface(). Did you "
+            "mean interface.IsImplementation()?"
+        )
+
+
+def _MakeImplementsInterfaceOnDie(
+    interfaces: tuple[Any, ...], called: list[bool]
+) -> Callable[[Any], None]:
+    def _OnDie(ref: Any) -> None:
+        # We may just use warnings.warn in the future, after our
+        # codebase is properly 'sanitized', instead of handle_exception.
+        #
+        # This is to prevent users of doing an ImplementsInterface()
+        # without using it as a decorator.
+        if not called[0]:
+            created_at_line: Union[str, "StackSummary"]
+            if not DEBUG:
+                created_at_line = "\nSet DEBUG == True in: {} to see location.".format(
+                    __file__
+                )
             else:
-                all_interfaces = interfaces
-            namespace.__implements__ = all_interfaces  # type:ignore[attr-defined]
-
-            if not no_check:
-                if IsDevelopment():  # Only doing check in dev mode.
-                    for I in interfaces:
-                        # Will do full checking this first time, and also cache the results
-                        AssertImplements(type_, I)
-
-            return type_
-
-        def __bool__(self) -> NoReturn:
-            called[0] = True
-            raise RuntimeError(
-                "Invalid attempt to test interface.ImplementsInterface(). Did you "
-                "mean interface.IsImplementation()?"
+                # This may be slow, so, just do it if DEBUG is enabled.
+                import traceback
+
+                created_at_line = traceback.extract_stack(sys._getframe(), limit=10)
+
+            if isinstance(created_at_line, str):
+                created_at_str = created_at_line
+            else:
+                created_at_str = "".join(traceback.format_list(created_at_line))
+
+            raise AssertionError(
+                "A call with ImplementsInterface({}) was not properly done as a class decorator.\nCreated at: {}".format(
+                    ", ".join(
+                        tuple(str(getattr(x, "__name__", x)) for x in interfaces)
+                    ),
+                    created_at_str,
+                )
             )
 
-    return Check()
+    return _OnDie
 
 
 def DeclareClassImplements(class_: type, *interfaces: InterfaceType) -> None:
@@ -995,9 +1077,10 @@ def DeclareClassImplements(class_: type, *interfaces: InterfaceType) -> None:
     try:
         for interface in interfaces:
             # Forget any previous checks
-            __ImplementsCache.pop((class_, interface, False), None)
-            __ImplementsCache.pop((class_, interface, True), None)
-            __ImplementedInterfacesCache.pop(class_, None)
+            class_results = __ImplementsCache.get(id(class_), {})
+            class_results.pop((interface, False), None)
+            class_results.pop((interface, True), None)
+            __ImplementedInterfacesCache.pop(id(class_), None)
 
             AssertImplements(class_, interface, requires_declaration=False)
     except:
@@ -1029,25 +1112,25 @@ def _GetMROForOldStyleClass(class_: type) -> list[type]:
 
 
 def _GetClassImplementedInterfaces(class_: type) -> frozenset[InterfaceType]:
-    with suppress(KeyError):
-        return __ImplementedInterfacesCache[class_]
+    cached = __ImplementedInterfacesCache.get(id(class_))
+    if cached is not None:
+        return cached
 
-    implemented_interfaces = set()
+    implemented_interfaces: set[InterfaceType] = set()
 
-    mro = inspect.getmro(class_)
-
-    for c in mro:
-        interfaces = getattr(c, "__implements__", ())
-        for interface in interfaces:
-            interface_mro = inspect.getmro(interface)
+    # The bases already have the interfaces of the rest of the mro (cached), so only the ones
+    # declared for the class (or inherited directly) need to be added.
+    for base in class_.__bases__:
+        implemented_interfaces.update(_GetClassImplementedInterfaces(base))
 
-            for interface_type in interface_mro:
-                if interface_type in (Interface, object):
-                    continue
-                implemented_interfaces.add(interface_type)
+    for interface in getattr(class_, "__implements__", ()):
+        implemented_interfaces.update(inspect.getmro(interface))
+    implemented_interfaces.discard(Interface)
+    implemented_interfaces.discard(object)
 
     result = frozenset(implemented_interfaces)
-    __ImplementedInterfacesCache[class_] = result
+    _TrackClass(class_)
+    __ImplementedInterfacesCache[id(class_)] = result
     return result
 
 
@@ -1,10 +1,15 @@
+from typing import Any
 from typing import List
 
+import gc
 import pytest
 import re
+import sys
 import textwrap
+import weakref
 
 from oop_ext import interface
+from oop_ext.foundation import is_frozen
 from oop_ext.foundation.decorators import Abstract
 from oop_ext.foundation.decorators import Implements
 from oop_ext.foundation.decorators import Override
@@ -366,6 +371,32 @@ def testStubsFromInstances() -> None:
         stub.bar()  # type:ignore[attr-defined]
 
 
+def testStubsFromSubInterfaces() -> None:
+    """The members of a stub of an interface are not reused for its sub-interfaces"""
+
+    class IFoo(Interface):
+        def foo(self): ...
+
+    class IFooBar(IFoo):
+        def bar(self): ...
+
+    class FooBar:
+        def foo(self):
+            return 10
+
+        def bar(self):
+            return 20
+
+    foo_stub = IFoo(FooBar())
+    with pytest.raises(AttributeError):
+        foo_stub.bar()  # type:ignore[attr-defined]
+
+    foo_bar_stub = IFooBar(FooBar())
+    assert (foo_bar_stub.foo(), foo_bar_stub.bar()) == (10, 20)
+    # Creating a stub again reuses the members.
+    assert IFoo(FooBar()).foo() == 10
+
+
 def testIsImplementationWithSubclasses() -> None:
     """
     Checks if the IsImplementation method works with subclasses interfaces.
@@ -501,6 +532,63 @@ def testGetImplementedInterfaces2() -> None:
     AssertImplements(B(), _InterfM2)
 
 
+def testCachesDoNotKeepClassesAlive() -> None:
+    @ImplementsInterface(_InterfM1)
+    class A:
+        def m1(self):
+            """ """
+
+    assert IsImplementation(A(), _InterfM1)
+    assert not IsImplementation(A(), _InterfM2)
+    assert GetImplementedInterfaces(A) == {_InterfM1}
+
+    class_ref = weakref.ref(A)
+    del A
+    gc.collect()
+    assert class_ref() is None
+
+
+def testCachesDoNotKeepClassMethodsAlive() -> None:
+    class IFoo(Interface):
+        @classmethod
+        def foo(cls):
+            """ """
+
+    @ImplementsInterface(IFoo)
+    class A:
+        @classmethod
+        def foo(cls):
+            """ """
+
+    AssertImplements(A, IFoo)
+
+    class_ref = weakref.ref(A)
+    del A
+    gc.collect()
+    assert class_ref() is None
+
+
+def testCachesDoNotKeepInterfacesAlive() -> None:
+    class _ILocal(_InterfM1):
+        pass
+
+    # Checking the implementation caches the interface attributes, so skip it.
+    @ImplementsInterface(_ILocal, no_check=True)
+    class A:
+        def m1(self):
+            """ """
+
+    assert GetImplementedInterfaces(A) == {_ILocal, _InterfM1}
+
+    interface_ref = weakref.ref(_ILocal)
+    del A, _ILocal
+    # The cache entry of `A` (which refers to the interface) is only removed when `A` is
+    # collected, so the interface is only collected in the next pass.
+    gc.collect()
+    gc.collect()
+    assert interface_ref() is None
+
+
 def testAdaptableInterface() -> None:
     @ImplementsInterface(IAdaptable)
     class A:
@@ -519,8 +607,11 @@ def testAdaptableInterface() -> None:
     )  # will try to adapt, as it does not directly implement m1
     assert b is not None
     b.m1()  # type:ignore[attr-defined]
-    with pytest.raises(AttributeError):
+    with pytest.raises(
+        AttributeError, match="does not have the attribute 'non_existent'"
+    ):
         getattr(b, "non_existent")
+    assert not hasattr(b, "__non_existent__")
 
     assert isinstance(b, InterfaceImplementorStub)
 
@@ -735,6 +826,22 @@ def testDeclareClassImplements() -> None:
     AssertImplements(C12, I2)
 
 
+def testImplementsInterfaceAfterDeclareClassImplements() -> None:
+    class C1:
+        def m1(self):
+            """ """
+
+    DeclareClassImplements(C1, _InterfM1)
+
+    @ImplementsInterface(_InterfM2)
+    class C2(C1):
+        def m2(self):
+            """ """
+
+    assert C2.__implements__ == (_InterfM1, _InterfM2)  # type:ignore[attr-defined]
+    assert GetImplementedInterfaces(C2) == {_InterfM1, _InterfM2}
+
+
 def testCallableInterfaceStub() -> None:
     """
     Validates that is possible to create stubs for interfaces of callables (i.e. declaring
@@ -799,6 +906,24 @@ def testImplementsInterfaceAsBoolError() -> None:
             pytest.fail('Managed to test "if ImplementsInterface(obj, I1):"')
 
 
+def testImplementsInterfaceNotUsedAsDecorator(monkeypatch) -> None:
+    errors: List[Any] = []
+    monkeypatch.setattr(sys, "unraisablehook", errors.append)
+
+    was_development = is_frozen.SetIsDevelopment(True)
+    try:
+        ImplementsInterface(_InterfM1)
+        assert len(errors) == 1
+        assert isinstance(errors[0].exc_value, AssertionError)
+
+        # Not checked outside development mode.
+        is_frozen.SetIsDevelopment(False)
+        ImplementsInterface(_InterfM1)
+        assert len(errors) == 1
+    finally:
+        is_frozen.SetIsDevelopment(was_development)
+
+
 @pytest.mark.parametrize("check_before", [True, False])
 @pytest.mark.parametrize("autospec", [True, False])
 def test_interface_subclass_mocked(mocker, check_before, autospec) -> None: